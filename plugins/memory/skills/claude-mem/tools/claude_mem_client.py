@@ -22,22 +22,41 @@ Usage:
 Requirements:
     - Python 3.8+
     - requests library (pip install requests)
+    - Optional: orjson (faster JSON decoding), msgspec (typed observation
+      decoding), ijson (iter_observations streaming), httpx
+      (AsyncClaudeMemClient)
 """
 
 from __future__ import annotations
 
-import json
+import re
+import sys
+import threading
 import time
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Optional, Union
-from urllib.parse import urlencode
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     raise ImportError("Please install requests: pip install requests")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+# asyncio, concurrent.futures, httpx, msgspec and ijson are imported where
+# they are used, keeping them out of short-lived CLI processes
+
 
 # ============================================================================
 # Configuration
@@ -46,13 +65,68 @@ except ImportError:
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 37777
 DEFAULT_TIMEOUT = 30  # seconds
+DEFAULT_POOL_SIZE = 32
+DEFAULT_CHUNK_SIZE = 25  # observation IDs per batch request
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_CACHE_TTL = 5.0  # seconds
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CONTEXT_TTL = 60.0  # seconds a context string is served as fresh
+DEFAULT_CONTEXT_STALE = 300.0  # further seconds it is served while refreshing
+DEFAULT_NEGATIVE_CACHE_TTL = 0.2  # seconds a "not ready" answer is reused
+
+# Fixed endpoints whose absolute URLs are built once per client
+ENDPOINTS = (
+    "/api/health", "/api/readiness", "/api/version",
+    "/api/search", "/api/timeline", "/api/observations/batch",
+    "/api/decisions", "/api/changes", "/api/how-it-works",
+    "/api/context/inject", "/api/context/recent",
+    "/api/settings", "/api/admin/restart", "/api/admin/shutdown",
+)
+
+# Observation types with a dedicated (query-less) listing endpoint
+SHORTCUT_ENDPOINTS = {
+    "decision": "/api/decisions",
+    "change": "/api/changes",
+    "how-it-works": "/api/how-it-works",
+}
+
+# POST endpoints that only read, so they must not invalidate the GET cache
+_READ_ONLY_POSTS = frozenset({"/api/observations/batch"})
+
+# Markdown table rows: | #{id} | {date} | {type} | {title} |
+# Header ("| ID") and separator ("|--") rows never match the numeric id cell.
+_ROW_RE = re.compile(
+    r"^\|[ \t]*#?[ \t]*(\d+)[ \t]*\|[ \t]*([^|\n]*?)[ \t]*\|[ \t]*([^|\n]*?)[ \t]*\|[ \t]*([^|\n]*?)[ \t]*\|",
+    re.M,
+)
+# Timeline rows: | #{id} | {time} | {type} | {title} | or | #{id} | {time} | {title} |
+_TIMELINE_ROW_RE = re.compile(
+    r"^\|[ \t]*#?[ \t]*(\d+)[ \t]*\|[ \t]*([^|\n]*?)[ \t]*\|[ \t]*([^|\n]*?)[ \t]*\|(?:[ \t]*([^|\n]*?)[ \t]*\|)?",
+    re.M,
+)
+
+# The only GET endpoints whose responses are cached, with their TTLs in
+# seconds (None: the client's cache_ttl). Observation data is never cached
+# because hook processes write observations at any time
+CACHE_TTLS = {
+    "/api/version": 3600.0,
+    "/api/health": 1.0,
+    "/api/settings": None,
+}
 
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+# Slotted instances drop the per-object __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Queued background work is dropped on close (Python 3.9+)
+_CANCEL_FUTURES = {"cancel_futures": True} if sys.version_info >= (3, 9) else {}
+
+
+@dataclass(**_SLOTS)
 class SearchResult:
     """A single search result from the index."""
     id: int
@@ -63,7 +137,7 @@ class SearchResult:
     project: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TimelineItem:
     """An item in a timeline view."""
     id: int
@@ -73,7 +147,7 @@ class TimelineItem:
     position: str  # "before", "anchor", or "after"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Observation:
     """A full observation with all details."""
     id: int
@@ -108,7 +182,32 @@ class Observation:
         )
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _observations_decoder():
+    """
+    msgspec decoder for batch responses, built on first use.
+
+    It decodes straight into Observation instances in C. None without
+    msgspec.
+    """
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return msgspec.json.Decoder(List[Observation])
+
+
+@lru_cache(maxsize=None)
+def _ijson():
+    """ijson, imported on first use; None without it."""
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+
+@dataclass(**_SLOTS)
 class SessionSummary:
     """A session summary."""
     id: int
@@ -122,7 +221,7 @@ class SessionSummary:
     created_at: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TimelineResult:
     """Result of a timeline query."""
     anchor: int
@@ -131,7 +230,7 @@ class TimelineResult:
     anchor_item: Optional[TimelineItem] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HealthStatus:
     """Worker health status."""
     status: str
@@ -142,11 +241,248 @@ class HealthStatus:
     build: Optional[str] = None
 
 
+# (response key, default) in HealthStatus field order
+_HEALTH_FIELDS = (
+    ("status", "unknown"),
+    ("initialized", False),
+    ("mcpReady", False),
+    ("platform", "unknown"),
+    ("pid", 0),
+    ("build", None),
+)
+
+
+# ============================================================================
+# Response Decoding and Cache
+# ============================================================================
+
+_MISSING = object()
+
+# Request bodies are serialized here rather than by requests' json=
+_EMPTY_JSON = b"{}"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a JSON request body, preferring orjson when installed."""
+    if not data and isinstance(data, dict):
+        return _EMPTY_JSON
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    Keys are tuples whose first element is the request path, which lets
+    invalidate() drop every entry under a path prefix. Stored keys carry
+    a version token, so a full invalidation is a counter bump: orphaned
+    entries are never served again and age out through LRU eviction.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._version = 0
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Any:
+        """Return the cached value, or _MISSING if absent or expired."""
+        with self._lock:
+            versioned = (self._version, *key)
+            entry = self._entries.get(versioned)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[versioned]
+                return _MISSING
+            self._entries.move_to_end(versioned)
+            return value
+
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the least recently used."""
+        with self._lock:
+            versioned = (self._version, *key)
+            self._entries[versioned] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(versioned)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path_prefix: str = "") -> None:
+        """Drop every entry whose path starts with path_prefix (all if empty)."""
+        with self._lock:
+            if not path_prefix:
+                self._version += 1
+                return
+            for key in [k for k in self._entries if k[1].startswith(path_prefix)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ============================================================================
+# Response Parsing
+# ============================================================================
+
+class _ResponseParser:
+    """Request building and response parsing shared by the sync and async clients."""
+
+    def _search_params(
+        self,
+        query: str,
+        *,
+        limit: int,
+        project: Optional[str] = None,
+        type: Optional[str] = None,
+        obs_type: Optional[str] = None,
+        date_start: Optional[str] = None,
+        date_end: Optional[str] = None,
+        offset: int = 0,
+        order_by: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Build /api/search query parameters."""
+        params = {"query": query, "limit": limit}
+
+        if project:
+            params["project"] = project
+        if type:
+            params["type"] = type
+        if obs_type:
+            params["obs_type"] = obs_type
+        if date_start:
+            params["dateStart"] = date_start
+        if date_end:
+            params["dateEnd"] = date_end
+        if offset:
+            params["offset"] = offset
+        if order_by:
+            params["orderBy"] = order_by
+
+        return params
+
+    def _timeline_params(
+        self,
+        anchor: Optional[int],
+        query: Optional[str],
+        depth_before: int,
+        depth_after: int,
+        project: Optional[str],
+    ) -> dict[str, Any]:
+        """Build /api/timeline query parameters."""
+        if anchor is None and query is None:
+            raise ValueError("Either anchor or query must be provided")
+
+        params = {
+            "depth_before": depth_before,
+            "depth_after": depth_after,
+        }
+
+        if anchor:
+            params["anchor"] = anchor
+        if query:
+            params["query"] = query
+        if project:
+            params["project"] = project
+
+        return params
+
+    def _parse_health(self, response: dict[str, Any]) -> HealthStatus:
+        """Parse health API response."""
+        return HealthStatus(*[response.get(key, default) for key, default in _HEALTH_FIELDS])
+
+    def _decode_observations(self, content: bytes) -> list[Observation]:
+        """Decode an observation batch response body."""
+        decoder = _observations_decoder()
+        if decoder is not None:
+            import msgspec
+
+            try:
+                return decoder.decode(content)
+            except msgspec.MsgspecError:
+                pass  # Missing fields, non-list or malformed body: previous path
+
+        data = _loads(content)
+        if isinstance(data, list):
+            return [Observation.from_dict(item) for item in data]
+        return []
+
+    def _parse_search_results(self, response: dict[str, Any]) -> list[SearchResult]:
+        """Parse search API response into SearchResult objects."""
+        # Response format: { "content": [{ "type": "text", "text": "..." }] }
+        content = response.get("content", [])
+        if not content:
+            return []
+
+        # Parse the table format
+        text = content[0].get("text", "") if content else ""
+        return self._parse_table_results(text)
+
+    def _parse_table_results(self, text: str) -> list[SearchResult]:
+        """Parse markdown table format into SearchResult objects."""
+        return [
+            SearchResult(id=int(m[1]), date=m[2], type=m[3], title=m[4])
+            for m in _ROW_RE.finditer(text)
+        ]
+
+    def _parse_timeline_result(self, response: dict[str, Any]) -> TimelineResult:
+        """Parse timeline API response."""
+        content = response.get("content", [])
+        text = content[0].get("text", "") if content else ""
+
+        # Parse timeline sections
+        before = []
+        after = []
+        anchor_id = 0
+
+        # This is a simplified parser - actual implementation would parse
+        # the markdown format more robustly
+        sections = text.split("### ")
+        for section in sections:
+            if section.startswith("Before"):
+                before = self._parse_timeline_section(section, "before")
+            elif section.startswith("After"):
+                after = self._parse_timeline_section(section, "after")
+            elif section.startswith("Anchor"):
+                anchor_items = self._parse_timeline_section(section, "anchor")
+                if anchor_items:
+                    anchor_id = anchor_items[0].id
+
+        return TimelineResult(
+            anchor=anchor_id,
+            before=before,
+            after=after,
+        )
+
+    def _parse_timeline_section(self, section: str, position: str) -> list[TimelineItem]:
+        """Parse a timeline section."""
+        return [
+            TimelineItem(
+                id=int(m[1]),
+                time=m[2],
+                type=m[3] if m[4] is not None else "",
+                title=m[4] if m[4] is not None else m[3],
+                position=position,
+            )
+            for m in _TIMELINE_ROW_RE.finditer(section)
+        ]
+
+
 # ============================================================================
 # Client Implementation
 # ============================================================================
 
-class ClaudeMemClient:
+class ClaudeMemClient(_ResponseParser):
     """
     Client for the claude-mem worker service HTTP API.
 
@@ -161,6 +497,10 @@ class ClaudeMemClient:
         host: str = DEFAULT_HOST,
         port: int = DEFAULT_PORT,
         timeout: int = DEFAULT_TIMEOUT,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        context_ttl: float = DEFAULT_CONTEXT_TTL,
+        context_stale: float = DEFAULT_CONTEXT_STALE,
+        negative_cache_ttl: float = DEFAULT_NEGATIVE_CACHE_TTL,
     ):
         """
         Initialize the client.
@@ -169,10 +509,51 @@ class ClaudeMemClient:
             host: Worker service host (default: 127.0.0.1)
             port: Worker service port (default: 37777)
             timeout: Request timeout in seconds (default: 30)
+            cache_ttl: Lifetime of cached settings responses in seconds;
+                0 disables GET caching (default: 5)
+            context_ttl: Seconds a context string is served without
+                revalidation; 0 disables context caching (default: 60)
+            context_stale: Further seconds a stale context string is served
+                while it is refreshed in the background (default: 300)
+            negative_cache_ttl: Seconds is_ready() reuses a "not ready"
+                answer instead of probing again (default: 0.2)
         """
         self.base_url = f"http://{host}:{port}"
+        self._urls = {path: f"{self.base_url}{path}" for path in ENDPOINTS}
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache = TTLCache()
+        self.context_ttl = context_ttl
+        self.context_stale = context_stale
+        self._context: dict[tuple, tuple[float, str]] = {}
+        self._context_refreshing: set[tuple] = set()
+        self._context_lock = threading.Lock()
+        self._refresher: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+        self.negative_cache_ttl = negative_cache_ttl
+        self._last_not_ready_at = float("-inf")
         self._session = requests.Session()
+        self._session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        adapter = HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Release pooled connections and the background refresher."""
+        with self._context_lock:
+            self._closed = True
+            if self._refresher is not None:
+                self._refresher.shutdown(wait=False, **_CANCEL_FUTURES)
+                self._refresher = None
+        self._session.close()
+
+    def __enter__(self) -> ClaudeMemClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # ========================================================================
     # System Endpoints
@@ -189,15 +570,7 @@ class ClaudeMemClient:
             ConnectionError: If worker is not running.
         """
         try:
-            response = self._get("/api/health")
-            return HealthStatus(
-                status=response.get("status", "unknown"),
-                initialized=response.get("initialized", False),
-                mcp_ready=response.get("mcpReady", False),
-                platform=response.get("platform", "unknown"),
-                pid=response.get("pid", 0),
-                build=response.get("build"),
-            )
+            return self._parse_health(self._get("/api/health"))
         except requests.exceptions.ConnectionError:
             raise ConnectionError("Worker service is not running")
 
@@ -205,32 +578,48 @@ class ClaudeMemClient:
         """
         Check if worker is ready to accept requests.
 
+        Uses HEAD so the worker skips serializing a body nobody reads. A
+        "not ready" answer is reused for negative_cache_ttl seconds, so a
+        burst of callers during startup shares one probe.
+
         Returns:
             True if worker is initialized and ready.
         """
-        try:
-            response = self._request("GET", "/api/readiness")
-            return response.status_code == 200
-        except requests.exceptions.ConnectionError:
+        if time.monotonic() - self._last_not_ready_at < self.negative_cache_ttl:
             return False
+        return self._probe_ready()
 
-    def wait_for_ready(self, timeout: int = 30, poll_interval: float = 0.5) -> bool:
+    def wait_for_ready(
+        self,
+        timeout: int = 30,
+        poll_interval: float = 0.5,
+        initial_interval: float = 0.05,
+    ) -> bool:
         """
         Wait for worker to be ready.
 
+        Polls with exponential backoff: the first check is retried after
+        initial_interval, doubling up to poll_interval, so a worker that
+        comes up quickly is noticed quickly without hammering a slow one.
+
         Args:
             timeout: Maximum time to wait in seconds.
-            poll_interval: Time between checks in seconds.
+            poll_interval: Maximum time between checks in seconds.
+            initial_interval: Time before the first retry in seconds.
 
         Returns:
             True if worker became ready, False if timeout.
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if self.is_ready():
+        deadline = time.monotonic() + timeout
+        delay = initial_interval
+        while True:
+            if self._probe_ready():
                 return True
-            time.sleep(poll_interval)
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, poll_interval)
 
     def version(self) -> str:
         """
@@ -265,6 +654,10 @@ class ClaudeMemClient:
         Returns compact results with IDs for filtering before fetching details.
         Approximately 50-100 tokens per result.
 
+        An empty query filtered only by an obs_type that has a dedicated
+        endpoint (decision, change, how-it-works) is served by that
+        shortcut (decisions(), changes(), how_it_works()) instead.
+
         Args:
             query: Search query string.
             limit: Maximum results (default: 20).
@@ -279,23 +672,21 @@ class ClaudeMemClient:
         Returns:
             List of SearchResult objects.
         """
-        params = {"query": query, "limit": limit}
-
-        if project:
-            params["project"] = project
-        if type:
-            params["type"] = type
-        if obs_type:
-            params["obs_type"] = obs_type
-        if date_start:
-            params["dateStart"] = date_start
-        if date_end:
-            params["dateEnd"] = date_end
-        if offset:
-            params["offset"] = offset
-        if order_by:
-            params["orderBy"] = order_by
-
+        if (
+            not query
+            and obs_type in SHORTCUT_ENDPOINTS
+            and not (type or date_start or date_end or offset or order_by)
+        ):
+            params = {"limit": limit}
+            if project:
+                params["project"] = project
+            response = self._get(SHORTCUT_ENDPOINTS[obs_type], params)
+            return self._parse_search_results(response)
+
+        params = self._search_params(
+            query, limit=limit, project=project, type=type, obs_type=obs_type,
+            date_start=date_start, date_end=date_end, offset=offset, order_by=order_by,
+        )
         response = self._get("/api/search", params)
         return self._parse_search_results(response)
 
@@ -360,21 +751,7 @@ class ClaudeMemClient:
         Note:
             Either anchor OR query must be provided.
         """
-        if anchor is None and query is None:
-            raise ValueError("Either anchor or query must be provided")
-
-        params = {
-            "depth_before": depth_before,
-            "depth_after": depth_after,
-        }
-
-        if anchor:
-            params["anchor"] = anchor
-        if query:
-            params["query"] = query
-        if project:
-            params["project"] = project
-
+        params = self._timeline_params(anchor, query, depth_before, depth_after, project)
         response = self._get("/api/timeline", params)
         return self._parse_timeline_result(response)
 
@@ -395,27 +772,70 @@ class ClaudeMemClient:
         response = self._get(f"/api/observation/{id}")
         return Observation.from_dict(response)
 
-    def get_observations(self, ids: list[int]) -> list[Observation]:
+    def get_observations(
+        self,
+        ids: list[int],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[Observation]:
         """
         Layer 3: Fetch full details for multiple observations.
 
         Always batch requests for efficiency. Approximately 500-1000 tokens
-        per observation.
+        per observation. Lists longer than chunk_size are split into chunks
+        fetched concurrently over the pooled session; order is preserved.
 
         Args:
             ids: List of observation IDs to fetch.
+            chunk_size: IDs per batch request (default: 25).
+            max_workers: Concurrent batch requests (default: 4).
 
         Returns:
             List of full Observation objects.
         """
         if not ids:
             return []
+        if len(ids) <= chunk_size:
+            return self._post_observations(ids)
 
-        response = self._post("/api/observations/batch", {"ids": ids})
+        from concurrent.futures import ThreadPoolExecutor
 
-        if isinstance(response, list):
-            return [Observation.from_dict(item) for item in response]
-        return []
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._post_observations, chunks))
+        return [obs for chunk in results for obs in chunk]
+
+    def iter_observations(self, ids: list[int]) -> Iterator[Observation]:
+        """
+        Stream full details for multiple observations.
+
+        With ijson installed, observations are yielded as the (possibly
+        gzip-compressed) batch response is decoded, so peak memory holds
+        one observation rather than the whole payload. Without ijson this
+        falls back to get_observations().
+
+        Args:
+            ids: List of observation IDs to fetch.
+
+        Yields:
+            Full Observation objects in response order.
+        """
+        if not ids:
+            return
+        ijson = _ijson()
+        if ijson is None:
+            yield from self.get_observations(ids)
+            return
+
+        response = self._request(
+            "POST", "/api/observations/batch", json_data={"ids": ids}, stream=True
+        )
+        with response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            for item in ijson.items(response.raw, "item"):
+                yield Observation.from_dict(item)
 
     # ========================================================================
     # Semantic Shortcuts
@@ -458,6 +878,10 @@ class ClaudeMemClient:
         """
         Get context injection string for a project.
 
+        Served stale-while-revalidate: within context_ttl the cached string
+        is returned; for a further context_stale seconds it is still
+        returned immediately while a background refresh runs.
+
         Args:
             project: Project name.
             use_colors: Enable ANSI color codes.
@@ -469,8 +893,7 @@ class ClaudeMemClient:
         if use_colors:
             params["colors"] = "true"
 
-        response = self._request("GET", "/api/context/inject", params=params)
-        return response.text
+        return self._get_context_text(params)
 
     def get_context_multi(
         self,
@@ -492,8 +915,7 @@ class ClaudeMemClient:
         if use_colors:
             params["colors"] = "true"
 
-        response = self._request("GET", "/api/context/inject", params=params)
-        return response.text
+        return self._get_context_text(params)
 
     def get_recent_context(
         self,
@@ -556,6 +978,22 @@ class ClaudeMemClient:
         """
         return self._post("/api/settings", settings)
 
+    # ========================================================================
+    # Cache Control
+    # ========================================================================
+
+    def invalidate(self, path_prefix: str = "") -> None:
+        """
+        Drop cached GET responses.
+
+        Args:
+            path_prefix: Only drop entries under this path (default: all).
+        """
+        self._cache.invalidate(path_prefix)
+        with self._context_lock:
+            for key in [k for k in self._context if k[0].startswith(path_prefix)]:
+                del self._context[key]
+
     # ========================================================================
     # Progressive Disclosure Workflow
     # ========================================================================
@@ -623,119 +1061,292 @@ class ClaudeMemClient:
         path: str,
         params: Optional[dict] = None,
         json_data: Optional[dict] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Make an HTTP request."""
-        url = f"{self.base_url}{path}"
-
-        if params:
-            url = f"{url}?{urlencode(params)}"
+        body = headers = None
+        if json_data is not None:
+            body, headers = _dumps(json_data), _JSON_HEADERS
 
         response = self._session.request(
             method=method,
-            url=url,
-            json=json_data,
+            url=self._urls.get(path) or f"{self.base_url}{path}",
+            params=params,
+            data=body,
+            headers=headers,
             timeout=self.timeout,
+            stream=stream,
         )
 
         return response
 
+    def _probe_ready(self) -> bool:
+        """Probe /api/readiness, recording the answer for is_ready()."""
+        try:
+            ready = self._request("HEAD", "/api/readiness").status_code == 200
+        except requests.exceptions.ConnectionError:
+            ready = False
+
+        self._last_not_ready_at = float("-inf") if ready else time.monotonic()
+        return ready
+
     def _get(self, path: str, params: Optional[dict] = None) -> dict[str, Any]:
-        """Make a GET request and parse JSON response."""
+        """Make a GET request and parse JSON response, served from cache when fresh."""
+        ttl = 0.0
+        if self.cache_ttl > 0 and path in CACHE_TTLS:
+            ttl = CACHE_TTLS[path] or self.cache_ttl
+        key = (path, tuple(sorted((params or {}).items())))
+
+        body = self._cache.get(key) if ttl > 0 else _MISSING
+        if body is _MISSING:
+            body = self._fetch(path, params)
+            if ttl > 0:
+                self._cache.set(key, body, ttl)
+
+        # The cache holds raw bodies; decoding per call gives every caller
+        # its own objects to modify
+        return _loads(body)
+
+    def _fetch(self, path: str, params: Optional[dict] = None) -> bytes:
+        """Issue an uncached GET request and return the response body."""
         response = self._request("GET", path, params=params)
         response.raise_for_status()
-        return response.json()
+        return response.content
 
     def _post(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
         """Make a POST request and parse JSON response."""
         response = self._request("POST", path, json_data=data)
         response.raise_for_status()
-        return response.json()
 
-    def _parse_search_results(self, response: dict[str, Any]) -> list[SearchResult]:
-        """Parse search API response into SearchResult objects."""
-        # Response format: { "content": [{ "type": "text", "text": "..." }] }
-        content = response.get("content", [])
-        if not content:
-            return []
+        if path not in _READ_ONLY_POSTS:
+            # Writes (settings, admin) may change anything a GET returns;
+            # dropping entries only once the write has landed keeps a
+            # concurrent GET from re-caching the old data
+            self.invalidate()
 
-        # Parse the table format
-        text = content[0].get("text", "") if content else ""
-        return self._parse_table_results(text)
+        return _loads(response.content)
 
-    def _parse_table_results(self, text: str) -> list[SearchResult]:
-        """Parse markdown table format into SearchResult objects."""
-        results = []
-        lines = text.strip().split("\n")
-
-        # Skip header and separator lines
-        for line in lines:
-            if not line.startswith("|") or line.startswith("| ID") or line.startswith("|--"):
-                continue
-
-            parts = [p.strip() for p in line.split("|")[1:-1]]  # Remove empty first/last
-            if len(parts) >= 4:
-                try:
-                    # Format: | #{id} | {date} | {type} | {title} |
-                    id_str = parts[0].replace("#", "").strip()
-                    results.append(SearchResult(
-                        id=int(id_str),
-                        date=parts[1],
-                        type=parts[2],
-                        title=parts[3],
-                    ))
-                except (ValueError, IndexError):
-                    continue
-
-        return results
+    def _get_context_text(self, params: dict[str, Any]) -> str:
+        """Fetch /api/context/inject text, stale-while-revalidate."""
+        if self.context_ttl <= 0:
+            return self._fetch_context_text(params)
 
-    def _parse_timeline_result(self, response: dict[str, Any]) -> TimelineResult:
-        """Parse timeline API response."""
-        content = response.get("content", [])
-        text = content[0].get("text", "") if content else ""
+        key = ("/api/context/inject", tuple(sorted(params.items())))
+        with self._context_lock:
+            entry = self._context.get(key)
 
-        # Parse timeline sections
-        before = []
-        after = []
-        anchor_id = 0
+        if entry is not None:
+            cached_at, text = entry
+            age = time.monotonic() - cached_at
+            if age < self.context_ttl:
+                return text
+            if age < self.context_ttl + self.context_stale:
+                self._schedule_context_refresh(key, params)
+                return text
 
-        # This is a simplified parser - actual implementation would parse
-        # the markdown format more robustly
-        sections = text.split("### ")
-        for section in sections:
-            if section.startswith("Before"):
-                before = self._parse_timeline_section(section, "before")
-            elif section.startswith("After"):
-                after = self._parse_timeline_section(section, "after")
-            elif section.startswith("Anchor"):
-                anchor_items = self._parse_timeline_section(section, "anchor")
-                if anchor_items:
-                    anchor_id = anchor_items[0].id
+        return self._fetch_context_text(params, key)
 
-        return TimelineResult(
-            anchor=anchor_id,
-            before=before,
-            after=after,
+    def _fetch_context_text(self, params: dict[str, Any], key: Optional[tuple] = None) -> str:
+        """Fetch context text, caching successful responses under key."""
+        response = self._request("GET", "/api/context/inject", params=params)
+        if key is not None and response.ok:
+            with self._context_lock:
+                self._context.pop(key, None)
+                self._context[key] = (time.monotonic(), response.text)
+                while len(self._context) > DEFAULT_CACHE_SIZE:
+                    del self._context[next(iter(self._context))]
+        return response.text
+
+    def _schedule_context_refresh(self, key: tuple, params: dict[str, Any]) -> None:
+        """Refresh a stale context entry in the background, once per key."""
+        def refresh() -> None:
+            try:
+                self._fetch_context_text(params, key)
+            except requests.exceptions.RequestException:
+                pass  # Keep serving the stale entry; the next call retries
+            finally:
+                with self._context_lock:
+                    self._context_refreshing.discard(key)
+
+        # Checked and submitted under the lock so close() cannot shut the
+        # executor down in between
+        with self._context_lock:
+            if self._closed or key in self._context_refreshing:
+                return
+            self._context_refreshing.add(key)
+            if self._refresher is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._refresher = ThreadPoolExecutor(max_workers=2)
+            self._refresher.submit(refresh)
+
+    def _post_observations(self, ids: list[int]) -> list[Observation]:
+        """Fetch one batch of observations."""
+        response = self._request("POST", "/api/observations/batch", json_data={"ids": ids})
+        response.raise_for_status()
+        return self._decode_observations(response.content)
+
+
+class AsyncClaudeMemClient(_ResponseParser):
+    """
+    Async client for the claude-mem worker service, built on httpx.
+
+    Mirrors the read API of ClaudeMemClient so independent calls can be
+    awaited concurrently. progressive_search overlaps the timeline and
+    detail fetches once the search IDs are known.
+
+    Usage:
+        async with AsyncClaudeMemClient() as client:
+            results, observations = await client.progressive_search("auth bug")
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        timeout: int = DEFAULT_TIMEOUT,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            host: Worker service host (default: 127.0.0.1)
+            port: Worker service port (default: 37777)
+            timeout: Request timeout in seconds (default: 30)
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("Please install httpx: pip install httpx")
+
+        self._connect_error = httpx.ConnectError
+        self.base_url = f"http://{host}:{port}"
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=DEFAULT_POOL_SIZE),
         )
 
-    def _parse_timeline_section(self, section: str, position: str) -> list[TimelineItem]:
-        """Parse a timeline section."""
-        items = []
-        for line in section.split("\n"):
-            if line.startswith("|") and not line.startswith("| ID") and not line.startswith("|--"):
-                parts = [p.strip() for p in line.split("|")[1:-1]]
-                if len(parts) >= 3:
-                    try:
-                        id_str = parts[0].replace("#", "").strip()
-                        items.append(TimelineItem(
-                            id=int(id_str),
-                            time=parts[1],
-                            type=parts[2] if len(parts) > 3 else "",
-                            title=parts[3] if len(parts) > 3 else parts[2],
-                            position=position,
-                        ))
-                    except (ValueError, IndexError):
-                        continue
-        return items
+    async def aclose(self) -> None:
+        """Release pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncClaudeMemClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def health(self) -> HealthStatus:
+        """Check worker health status (see ClaudeMemClient.health)."""
+        try:
+            return self._parse_health(await self._get("/api/health"))
+        except self._connect_error:
+            raise ConnectionError("Worker service is not running")
+
+    async def is_ready(self) -> bool:
+        """Check if worker is ready to accept requests."""
+        try:
+            response = await self._client.head("/api/readiness")
+            return response.status_code == 200
+        except self._connect_error:
+            return False
+
+    async def version(self) -> str:
+        """Get worker version."""
+        response = await self._get("/api/version")
+        return response.get("version", "unknown")
+
+    async def search(self, query: str, *, limit: int = 20, **filters: Any) -> list[SearchResult]:
+        """Layer 1: Search memory index (filters as for ClaudeMemClient.search)."""
+        params = self._search_params(query, limit=limit, **filters)
+        response = await self._get("/api/search", params)
+        return self._parse_search_results(response)
+
+    async def timeline(
+        self,
+        *,
+        anchor: Optional[int] = None,
+        query: Optional[str] = None,
+        depth_before: int = 5,
+        depth_after: int = 5,
+        project: Optional[str] = None,
+    ) -> TimelineResult:
+        """Layer 2: Get chronological context around a result."""
+        params = self._timeline_params(anchor, query, depth_before, depth_after, project)
+        response = await self._get("/api/timeline", params)
+        return self._parse_timeline_result(response)
+
+    async def get_observation(self, id: int) -> Observation:
+        """Get full details for a single observation."""
+        return Observation.from_dict(await self._get(f"/api/observation/{id}"))
+
+    async def get_observations(self, ids: list[int]) -> list[Observation]:
+        """Layer 3: Fetch full details for multiple observations."""
+        if not ids:
+            return []
+
+        response = await self._client.post(
+            "/api/observations/batch", content=_dumps({"ids": ids}), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        return self._decode_observations(response.content)
+
+    async def progressive_search(
+        self,
+        query: str,
+        *,
+        relevance_filter: Optional[callable] = None,
+        max_details: int = 5,
+        timeline_depth: int = 3,
+    ) -> tuple[list[SearchResult], list[Observation]]:
+        """
+        Execute the progressive disclosure workflow with layers 2 and 3 in parallel.
+
+        Args:
+            query: Search query.
+            relevance_filter: Optional function(results) -> list[ids] for filtering.
+            max_details: Maximum observations to fetch full details for.
+            timeline_depth: Depth for timeline context (0 to skip).
+
+        Returns:
+            Tuple of (search_results, detailed_observations).
+        """
+        results = await self.search(query, limit=20)
+
+        if not results:
+            return ([], [])
+
+        if relevance_filter:
+            relevant_ids = relevance_filter(results)
+        else:
+            relevant_ids = [r.id for r in results[:max_details]]
+
+        if not relevant_ids:
+            return (results, [])
+
+        import asyncio
+
+        observations_task = self.get_observations(relevant_ids[:max_details])
+        if timeline_depth > 0:
+            _, observations = await asyncio.gather(
+                self.timeline(
+                    anchor=relevant_ids[0],
+                    depth_before=timeline_depth,
+                    depth_after=timeline_depth,
+                ),
+                observations_task,
+            )
+        else:
+            observations = await observations_task
+
+        return (results, observations)
+
+    async def _get(self, path: str, params: Optional[dict] = None) -> Any:
+        """Make a GET request and parse JSON response."""
+        response = await self._client.get(path, params=params)
+        response.raise_for_status()
+        return _loads(response.content)
 
 
 # ============================================================================
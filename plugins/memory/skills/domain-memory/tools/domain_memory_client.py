@@ -7,7 +7,7 @@ Provides a clean interface for document storage, search, and summarization.
 
 Usage:
     client = DomainMemoryClient()
-    await client.connect()
+    await client.connect()  # optional; the first tool call connects lazily
 
     # Store a document
     doc = await client.store_document(
@@ -24,25 +24,55 @@ Usage:
 
 Requirements:
     pip install mcp
+    pip install orjson  # optional, faster response parsing
 
 Author: Domain Memory Agent
 License: MIT
 """
 
 import asyncio
+import copy
 import json
+import sys
+import time
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 try:
+    import anyio
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.stdio import stdio_client
     MCP_AVAILABLE = True
 except ImportError:
     MCP_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Read-only tools that are safe to resend after a broken transport
+_IDEMPOTENT_TOOLS = frozenset({
+    "get_document",
+    "list_documents",
+    "semantic_search",
+})
+
+# Slotted instances drop the per-object __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _loads(text: str) -> Any:
+    """Parse a JSON tool response, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@dataclass(**_SLOTS)
 class Document:
     """Represents a document in the knowledge base."""
     id: str
@@ -62,8 +92,8 @@ class Document:
             id=data.get("id", ""),
             title=data.get("title", ""),
             content=data.get("content", ""),
-            tags=data.get("tags", []),
-            metadata=data.get("metadata", {}),
+            tags=data.get("tags") or [],
+            metadata=data.get("metadata") or {},
             word_count=data.get("wordCount", 0),
             summary=data.get("summary"),
             created_at=data.get("createdAt", ""),
@@ -71,7 +101,7 @@ class Document:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SearchResult:
     """Represents a search result."""
     id: str
@@ -84,19 +114,25 @@ class SearchResult:
 
     @classmethod
     def from_dict(cls, data: dict) -> "SearchResult":
-        """Create SearchResult from API response dictionary."""
-        return cls(
-            id=data.get("id", ""),
-            title=data.get("title", ""),
-            score=data.get("score", 0.0),
-            relevant_excerpts=data.get("relevantExcerpts", []),
-            tags=data.get("tags", []),
-            word_count=data.get("wordCount", 0),
-            updated_at=data.get("updatedAt", ""),
-        )
-
+        """
+        Create SearchResult from API response dictionary.
 
-@dataclass
+        Fields are set directly, skipping __init__, since this runs once
+        per result in search().
+        """
+        get = data.get
+        result = object.__new__(cls)
+        result.id = get("id", "")
+        result.title = get("title", "")
+        result.score = get("score", 0.0)
+        result.relevant_excerpts = get("relevantExcerpts") or []
+        result.tags = get("tags") or []
+        result.word_count = get("wordCount", 0)
+        result.updated_at = get("updatedAt", "")
+        return result
+
+
+@dataclass(**_SLOTS)
 class Summary:
     """Represents a document summary."""
     summary: str
@@ -142,7 +178,10 @@ class DomainMemoryClient:
     def __init__(
         self,
         server_command: str = "npx",
-        server_args: Optional[list[str]] = None
+        server_args: Optional[list[str]] = None,
+        max_in_flight: int = 32,
+        cache_size: int = 128,
+        cache_ttl: float = 5.0
     ):
         """
         Initialize the client.
@@ -150,6 +189,10 @@ class DomainMemoryClient:
         Args:
             server_command: Command to start the MCP server
             server_args: Arguments for the server command
+            max_in_flight: Maximum outstanding tool calls on the session
+            cache_size: Documents and summaries kept in the LRU cache
+            cache_ttl: Seconds a cached document or summary is reused, so
+                writes from other clients show up; 0 disables caching
         """
         if not MCP_AVAILABLE:
             raise ImportError(
@@ -162,7 +205,14 @@ class DomainMemoryClient:
             "@anthropic/domain-memory-agent"
         ]
         self._session: Optional[ClientSession] = None
-        self._client = None
+        self._runner: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._connect_lock = asyncio.Lock()
+        self.max_in_flight = max_in_flight
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
 
     async def __aenter__(self) -> "DomainMemoryClient":
         """Async context manager entry."""
@@ -177,25 +227,123 @@ class DomainMemoryClient:
         """
         Connect to the MCP server.
 
-        Starts the server process and establishes communication.
+        Starts the server process and establishes communication. Safe to
+        call repeatedly or concurrently: one subprocess is kept per client.
+        """
+        async with self._connect_lock:
+            if self._session is None:
+                await self._open()
+
+    async def reconnect(self, stale=None):
+        """
+        Tear down the server process and start a fresh one.
+
+        Args:
+            stale: Session that failed; if another caller has already
+                replaced it, the current session is kept
+
+        Returns:
+            The live ClientSession
+        """
+        async with self._connect_lock:
+            if self._session is not None and self._session is stale:
+                try:
+                    await self._close()
+                except Exception:
+                    pass  # transport already gone; _close() reset the state
+            if self._session is None:
+                await self._open()
+            return self._session
+
+    async def disconnect(self):
+        """Disconnect from the MCP server."""
+        async with self._connect_lock:
+            await self._close()
+
+    async def _ensure_connected(self):
+        """Return the live session, starting the server on first use."""
+        if self._session is None:
+            await self.connect()
+        return self._session
+
+    async def _open(self):
+        """Start the session owner task and wait for its session."""
+        ready = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self._runner = asyncio.create_task(self._run_session(ready, self._stop))
+        try:
+            self._session = await ready
+        except BaseException:
+            # The owner task stops on its own once the session is up
+            self._stop.set()
+            self._runner = None
+            raise
+
+    async def _run_session(self, ready: asyncio.Future, stop: asyncio.Event):
+        """
+        Own the server process and session until stop is set.
+
+        The stdio transport and ClientSession hold anyio cancel scopes that
+        must be exited by the task that entered them, so both are entered
+        and exited here; callers in any task share the session.
         """
         server_params = StdioServerParameters(
             command=self.server_command,
             args=self.server_args,
         )
 
-        self._client = stdio_client(server_params)
-        self._read, self._write = await self._client.__aenter__()
-        self._session = ClientSession(self._read, self._write)
-        await self._session.__aenter__()
-        await self._session.initialize()
+        try:
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    if not ready.done():
+                        ready.set_result(session)
+                    await stop.wait()
+        except BaseException as exc:
+            if not ready.done():
+                ready.set_exception(exc)
+                return
+            raise
+
+    async def _close(self):
+        """Shut down the session and the server process."""
+        runner, stop = self._runner, self._stop
+        self._session = None
+        self._runner = None
+        self._stop = None
+        if runner:
+            stop.set()
+            await runner
+
+    def _cache_get(self, key: tuple) -> Any:
+        """
+        Return a copy of a fresh cached value and mark it most recently used.
 
-    async def disconnect(self):
-        """Disconnect from the MCP server."""
-        if self._session:
-            await self._session.__aexit__(None, None, None)
-        if self._client:
-            await self._client.__aexit__(None, None, None)
+        Copies keep callers from changing the cached entry.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def _cache_put(self, key: tuple, value: Any):
+        """Cache a copy of a value, evicting the least recently used entry."""
+        if self.cache_ttl <= 0:
+            return
+        self._cache[key] = (time.monotonic() + self.cache_ttl, copy.deepcopy(value))
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _cache_discard(self, document_id: str):
+        """Drop every cached document and summary for a document ID."""
+        for key in [key for key in self._cache if key[1] == document_id]:
+            del self._cache[key]
 
     async def _call_tool(self, tool_name: str, arguments: dict) -> dict:
         """
@@ -208,15 +356,26 @@ class DomainMemoryClient:
         Returns:
             Parsed JSON response from the tool
         """
-        if not self._session:
-            raise RuntimeError("Client not connected. Call connect() first.")
-
-        result = await self._session.call_tool(tool_name, arguments)
-
-        # Parse the text content from the response
-        if result.content and len(result.content) > 0:
-            text_content = result.content[0].text
-            return json.loads(text_content)
+        session = await self._ensure_connected()
+
+        # Cap outstanding JSON-RPC requests so the server never builds up
+        # an unbounded backlog from concurrent callers
+        async with self._in_flight:
+            try:
+                result = await session.call_tool(tool_name, arguments)
+            except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                session = await self.reconnect(stale=session)
+                # A write may have landed before the transport broke, so
+                # only reads are sent again
+                if tool_name not in _IDEMPOTENT_TOOLS:
+                    raise
+                result = await session.call_tool(tool_name, arguments)
+
+        # Parse the text content from the response; a payload may be split
+        # across several text blocks, and non-text blocks carry no JSON
+        parts = [block.text for block in result.content if block.type == "text"]
+        if parts:
+            return _loads("".join(parts))
 
         return {}
 
@@ -255,6 +414,22 @@ class DomainMemoryClient:
             )
             print(f"Stored document: {doc['id']}")
         """
+        arguments = self._store_arguments(
+            title, content, tags, metadata, document_id
+        )
+        result = await self._call_tool("store_document", arguments)
+        self._cache_discard(result.get("id", document_id))
+        return result
+
+    @staticmethod
+    def _store_arguments(
+        title: str,
+        content: str,
+        tags: Optional[list[str]],
+        metadata: Optional[dict[str, Any]],
+        document_id: Optional[str]
+    ) -> dict:
+        """Build store_document tool arguments, omitting unset fields."""
         arguments = {
             "title": title,
             "content": content,
@@ -265,8 +440,7 @@ class DomainMemoryClient:
             arguments["metadata"] = metadata
         if document_id:
             arguments["id"] = document_id
-
-        return await self._call_tool("store_document", arguments)
+        return arguments
 
     async def get_document(self, document_id: str) -> Document:
         """
@@ -281,8 +455,13 @@ class DomainMemoryClient:
         Raises:
             Exception: If document not found
         """
-        result = await self._call_tool("get_document", {"documentId": document_id})
-        return Document.from_dict(result)
+        key = ("document", document_id)
+        doc = self._cache_get(key)
+        if doc is None:
+            result = await self._call_tool("get_document", {"documentId": document_id})
+            doc = Document.from_dict(result)
+            self._cache_put(key, doc)
+        return doc
 
     async def delete_document(self, document_id: str) -> dict:
         """
@@ -299,7 +478,9 @@ class DomainMemoryClient:
         Raises:
             Exception: If document not found
         """
-        return await self._call_tool("delete_document", {"documentId": document_id})
+        result = await self._call_tool("delete_document", {"documentId": document_id})
+        self._cache_discard(document_id)
+        return result
 
     async def list_documents(
         self,
@@ -339,6 +520,24 @@ class DomainMemoryClient:
     # Search Operations
     # =========================================================================
 
+    @staticmethod
+    def _search_arguments(
+        query: str,
+        limit: int,
+        tags: Optional[list[str]],
+        min_score: float
+    ) -> dict:
+        """Build semantic_search arguments; the server owns min_score filtering."""
+        arguments = {
+            "query": query,
+            "limit": limit,
+        }
+        if min_score > 0.0:
+            arguments["minScore"] = min_score
+        if tags:
+            arguments["tags"] = tags
+        return arguments
+
     async def search(
         self,
         query: str,
@@ -369,13 +568,7 @@ class DomainMemoryClient:
                 for excerpt in result.relevant_excerpts:
                     print(f"  - {excerpt[:100]}...")
         """
-        arguments = {
-            "query": query,
-            "limit": limit,
-            "minScore": min_score,
-        }
-        if tags:
-            arguments["tags"] = tags
+        arguments = self._search_arguments(query, limit, tags, min_score)
 
         result = await self._call_tool("semantic_search", arguments)
         return [SearchResult.from_dict(r) for r in result.get("results", [])]
@@ -395,13 +588,7 @@ class DomainMemoryClient:
         Returns:
             Raw dictionary response with results, totalResults, query, showing
         """
-        arguments = {
-            "query": query,
-            "limit": limit,
-            "minScore": min_score,
-        }
-        if tags:
-            arguments["tags"] = tags
+        arguments = self._search_arguments(query, limit, tags, min_score)
 
         return await self._call_tool("semantic_search", arguments)
 
@@ -426,7 +613,9 @@ class DomainMemoryClient:
             regenerate: Force regenerate even if cached
 
         Returns:
-            Summary object
+            Summary object (stored-document summaries are cached for
+            cache_ttl seconds, or until the document is stored again or
+            deleted)
 
         Example:
             # Summarize stored document
@@ -448,8 +637,18 @@ class DomainMemoryClient:
         if content:
             arguments["content"] = content
 
+        key = ("summary", document_id, max_sentences)
+        cacheable = bool(document_id) and not content
+        if cacheable and not regenerate:
+            summary = self._cache_get(key)
+            if summary is not None:
+                return summary
+
         result = await self._call_tool("summarize", arguments)
-        return Summary.from_dict(result)
+        summary = Summary.from_dict(result)
+        if cacheable:
+            self._cache_put(key, summary)
+        return summary
 
     # =========================================================================
     # Utility Methods
@@ -482,16 +681,23 @@ class DomainMemoryClient:
 
     async def batch_store(
         self,
-        documents: list[dict]
+        documents: list[dict],
+        concurrency: int = 8
     ) -> list[dict]:
         """
         Store multiple documents.
 
+        Pipelines store_document calls over the single MCP session, with
+        at most `concurrency` requests in flight. If a store fails, the
+        stores still pending are cancelled before the error propagates;
+        documents already confirmed stay stored.
+
         Args:
             documents: List of document dictionaries with title, content, tags
+            concurrency: Maximum concurrent store requests
 
         Returns:
-            List of storage confirmations
+            List of storage confirmations, in input order
 
         Example:
             docs = [
@@ -500,46 +706,86 @@ class DomainMemoryClient:
             ]
             results = await client.batch_store(docs)
         """
-        results = []
-        for doc in documents:
-            result = await self.store_document(
-                title=doc["title"],
-                content=doc["content"],
-                tags=doc.get("tags"),
-                metadata=doc.get("metadata"),
-                document_id=doc.get("id"),
-            )
-            results.append(result)
-        return results
-
-    async def get_stats(self) -> dict:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def store_one(doc: dict) -> dict:
+            async with semaphore:
+                return await self.store_document(
+                    title=doc["title"],
+                    content=doc["content"],
+                    tags=doc.get("tags"),
+                    metadata=doc.get("metadata"),
+                    document_id=doc.get("id"),
+                )
+
+        tasks = [asyncio.ensure_future(store_one(doc)) for doc in documents]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave the remaining writes running unobserved
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def get_stats(
+        self,
+        page_size: int = 200,
+        top_k_tags: Optional[int] = None
+    ) -> dict:
         """
         Get knowledge base statistics.
 
+        Pages through list_documents() and aggregates client-side. Paging
+        stops at the reported total, or when a page comes back empty or
+        repeats the previous one, so servers that cap the page size or
+        ignore offset still terminate.
+
+        Args:
+            page_size: Documents fetched per list_documents() page
+            top_k_tags: Keep only the most frequent tags in
+                tag_distribution (default: all tags)
+
         Returns:
             Dictionary with total documents, tag counts, etc.
         """
-        docs = await self.list_documents(limit=1000)
-
-        tag_counts = {}
+        tag_counts = Counter()
         total_words = 0
         docs_with_summary = 0
-
-        for doc in docs.get("documents", []):
-            total_words += doc.get("wordCount", 0)
-            if doc.get("hasSummary"):
-                docs_with_summary += 1
-            for tag in doc.get("tags", []):
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        total_documents = 0
+        offset = 0
+        previous_ids = None
+
+        while True:
+            page = await self.list_documents(limit=page_size, offset=offset)
+            documents = page.get("documents", [])
+            total = page.get("total")
+            total_documents = total or 0
+
+            # An empty or repeated page means offset was not honoured
+            page_ids = [doc.get("id") for doc in documents]
+            if not documents or page_ids == previous_ids:
+                break
+            previous_ids = page_ids
+
+            for doc in documents:
+                total_words += doc.get("wordCount", 0)
+                if doc.get("hasSummary"):
+                    docs_with_summary += 1
+                tag_counts.update(doc.get("tags", []))
+
+            # Advance by what the server sent, which may be below page_size;
+            # without a total, paging runs until an empty page
+            offset += len(documents)
+            if total is not None and offset >= total:
+                break
 
         return {
-            "total_documents": docs.get("total", 0),
+            "total_documents": total_documents,
             "total_words": total_words,
             "documents_with_summary": docs_with_summary,
             "unique_tags": len(tag_counts),
-            "tag_distribution": dict(
-                sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-            ),
+            "tag_distribution": dict(tag_counts.most_common(top_k_tags)),
         }
 
 
@@ -3,7 +3,11 @@
 Standalone TF-IDF Calculator
 
 A pure Python implementation of TF-IDF (Term Frequency-Inverse Document Frequency)
-for text search and document ranking. Zero external dependencies.
+for text search and document ranking. Zero required dependencies; when NumPy
+is installed, search scores postings with vectorized array operations (or,
+opted into with use_numba, a compiled Numba kernel), and search_batch() uses
+SciPy sparse products when SciPy is installed. SciPy and Numba are imported
+on first use, so neither slows down loading the module.
 
 This implementation mirrors the Domain Memory Agent MCP server's algorithm,
 allowing offline experimentation, debugging, and custom integrations.
@@ -18,11 +22,23 @@ Author: Domain Memory Agent
 License: MIT
 """
 
+import heapq
+import itertools
 import math
 import re
-from collections import Counter
+import sys
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 
 # =============================================================================
@@ -41,12 +57,53 @@ STOP_WORDS = frozenset([
     "there", "any", "about", "above", "below", "up", "down", "out", "off",
 ])
 
+# Compiled once; tokenize() runs on every document and query
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_SENT_RE = re.compile(r'[.!?]+')
+
+# For ASCII text one str.translate pass does both steps: A-Z map to a-z
+# and the same punctuation _PUNCT_RE matches maps to spaces
+_ASCII_TABLE = str.maketrans({
+    chr(c): ' ' if _PUNCT_RE.match(chr(c)) else chr(c).lower()
+    for c in range(128)
+    if _PUNCT_RE.match(chr(c)) or chr(c).isupper()
+})
+
+# Texts up to this length (queries, titles, sentences) go through an LRU
+# cache, since the same short texts tend to be tokenized again and again
+_TOKENIZE_CACHE_MAX_LEN = 1024
+
+
+def _tokenize(text: str, min_length: int, stop_words) -> list[str]:
+    """Tokenize text; see TFIDFCalculator.tokenize()."""
+    # Lowercase and remove punctuation
+    if text.isascii():
+        text = text.translate(_ASCII_TABLE)
+    else:
+        text = _PUNCT_RE.sub(' ', text.lower())
+
+    # Split and filter in one pass
+    return [
+        t for t in text.split()
+        if len(t) >= min_length and t not in stop_words
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_cached(text: str, min_length: int, stop_words) -> tuple[str, ...]:
+    """_tokenize() memoized per (text, settings), as an immutable tuple."""
+    return tuple(_tokenize(text, min_length, stop_words))
+
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+# Slotted instances drop the per-object __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Document:
     """Represents an indexed document."""
     id: str
@@ -54,9 +111,13 @@ class Document:
     tokens: list[str] = field(default_factory=list)
     term_frequencies: dict[str, float] = field(default_factory=dict)
     metadata: dict = field(default_factory=dict)
+    # (sentence, token set) pairs, built on first excerpt extraction
+    sentence_index: Optional[list[tuple[str, frozenset[str]]]] = field(
+        default=None, compare=False, repr=False
+    )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SearchResult:
     """Represents a search result with scoring details."""
     doc_id: str
@@ -66,7 +127,7 @@ class SearchResult:
     excerpts: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TFIDFStats:
     """Statistics about the TF-IDF index."""
     total_documents: int
@@ -76,6 +137,79 @@ class TFIDFStats:
     term_distribution: dict[str, int]
 
 
+# =============================================================================
+# Compiled Kernels
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _scipy_sparse():
+    """scipy.sparse, imported on first use; None without SciPy."""
+    try:
+        from scipy import sparse
+    except ImportError:
+        return None
+    return sparse
+
+
+@lru_cache(maxsize=None)
+def _numba_kernels():
+    """
+    Compile the postings scoring kernels on first use.
+
+    Returns (serial kernel, parallel kernel, get_num_threads), or None
+    without Numba. Compiled code is cached on disk, so only the first
+    process to use them pays for the JIT.
+    """
+    try:
+        from numba import get_num_threads, njit, prange
+    except ImportError:
+        return None
+
+    @njit(fastmath=True, cache=True)
+    def score_postings(term_ids, weights, term_ptr, doc_rows, tfs, scores):
+        """Add tfs * weights[k] over the postings slice of each term_ids[k]."""
+        for k in range(term_ids.shape[0]):
+            term_id = term_ids[k]
+            weight = weights[k]
+            for p in range(term_ptr[term_id], term_ptr[term_id + 1]):
+                scores[doc_rows[p]] += tfs[p] * weight
+
+    @njit(fastmath=True, parallel=True, cache=True)
+    def score_postings_parallel(
+        term_ids, weights, term_ptr, doc_rows, tfs, scores, n_chunks
+    ):
+        """
+        score_postings() split across threads by doc row range.
+
+        Doc rows are ascending within each postings slice, so every chunk
+        finds its part of a slice by binary search and writes only its own
+        rows: no locking, no per-thread buffers, and each row sums its
+        terms in the same order as the serial kernel.
+        """
+        n_docs = scores.shape[0]
+        for c in prange(n_chunks):
+            low = c * n_docs // n_chunks
+            high = (c + 1) * n_docs // n_chunks
+            for k in range(term_ids.shape[0]):
+                start = term_ptr[term_ids[k]]
+                rows = doc_rows[start:term_ptr[term_ids[k] + 1]]
+                weight = weights[k]
+                for p in range(
+                    start + np.searchsorted(rows, low),
+                    start + np.searchsorted(rows, high)
+                ):
+                    scores[doc_rows[p]] += tfs[p] * weight
+
+    return score_postings, score_postings_parallel, get_num_threads
+
+
+# TFs are stored as uint16 multiples of 1 / _TF_SCALE in the NumPy arrays
+_TF_SCALE = 65535
+
+# Postings a query must touch before scoring is worth spreading over threads
+_PARALLEL_MIN_POSTINGS = 1 << 18
+
+
 # =============================================================================
 # TF-IDF Calculator
 # =============================================================================
@@ -85,7 +219,7 @@ class TFIDFCalculator:
     Pure Python TF-IDF implementation for document search and ranking.
 
     Features:
-    - Zero external dependencies
+    - Zero required dependencies (vectorized ranking with NumPy)
     - Configurable tokenization
     - Stop word filtering
     - Minimum term length filtering
@@ -107,7 +241,8 @@ class TFIDFCalculator:
         self,
         min_term_length: int = 3,
         use_stop_words: bool = True,
-        custom_stop_words: Optional[set[str]] = None
+        custom_stop_words: Optional[set[str]] = None,
+        use_numba: bool = False
     ):
         """
         Initialize the TF-IDF calculator.
@@ -116,20 +251,45 @@ class TFIDFCalculator:
             min_term_length: Minimum token length to include
             use_stop_words: Whether to filter stop words
             custom_stop_words: Additional stop words to filter
+            use_numba: Score postings with a compiled Numba kernel when
+                Numba is installed; pays off only for long-running
+                processes with large indexes, since the first search
+                compiles (or loads) the kernel
         """
         self.min_term_length = min_term_length
         self.use_stop_words = use_stop_words
-        self.stop_words = STOP_WORDS.copy()
+        # Shared frozenset unless extended; also hashable for tokenize()'s cache
+        self.stop_words = STOP_WORDS
         if custom_stop_words:
-            self.stop_words = self.stop_words | custom_stop_words
+            self.stop_words = STOP_WORDS | frozenset(custom_stop_words)
+        self.use_numba = use_numba
 
         # Document storage
         self._documents: dict[str, Document] = {}
+        self._doc_order: dict[str, int] = {}  # doc_id -> insertion sequence
+        self._order_counter = itertools.count()
 
         # TF-IDF index structures
-        self._term_frequencies: dict[str, dict[str, float]] = {}  # term -> {doc_id: tf}
-        self._document_frequencies: dict[str, int] = {}  # term -> doc count
+        self._term_frequencies: dict[str, dict[str, float]] = defaultdict(dict)  # term -> {doc_id: tf}
+        self._document_frequencies: dict[str, int] = defaultdict(int)  # term -> doc count
         self._document_lengths: dict[str, int] = {}  # doc_id -> token count
+        self._idf_cache: dict[str, float] = {}  # cleared whenever N or DF changes
+
+        # Structure-of-arrays TF store (NumPy only): each document's
+        # (term id, quantized tf) pairs occupy one span of the parallel arrays
+        self._vocab: dict[str, int] = {}  # term -> term id
+        self._row_spans: dict[str, tuple[int, int]] = {}  # doc_id -> [start, end)
+        self._nnz = 0
+        if NUMPY_AVAILABLE:
+            self._term_ids = np.empty(0, dtype=np.int32)
+            self._tfs = np.empty(0, dtype=np.uint16)
+
+        # Term-major postings compiled lazily from the arrays as
+        # (term_ptr, doc_rows, tfs, idf, max_tfs): term t's postings are the
+        # slice term_ptr[t]:term_ptr[t + 1] of doc_rows and tfs; idf[t] is
+        # its IDF and max_tfs[t] its largest quantized TF
+        self._postings = None
+        self._posting_doc_ids: list[str] = []  # doc row -> doc_id
 
     # =========================================================================
     # Tokenization
@@ -152,18 +312,12 @@ class TFIDFCalculator:
         Returns:
             List of normalized tokens
         """
-        # Lowercase and remove punctuation
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)
-
-        # Split and filter
-        tokens = text.split()
-        tokens = [t for t in tokens if len(t) >= self.min_term_length]
-
-        if self.use_stop_words:
-            tokens = [t for t in tokens if t not in self.stop_words]
-
-        return tokens
+        stop_words = self.stop_words if self.use_stop_words else ()
+        if len(text) <= _TOKENIZE_CACHE_MAX_LEN:
+            return list(
+                _tokenize_cached(text, self.min_term_length, stop_words)
+            )
+        return _tokenize(text, self.min_term_length, stop_words)
 
     # =========================================================================
     # Document Operations
@@ -186,12 +340,64 @@ class TFIDFCalculator:
         Returns:
             The indexed Document object
         """
+        doc = self._insert_document(doc_id, content, metadata)
+
+        if NUMPY_AVAILABLE:
+            self._append_rows([(doc_id, doc.term_frequencies)])
+        self._index_changed()
+
+        return doc
+
+    def add_documents(
+        self,
+        documents: Iterable[tuple]
+    ) -> list[Document]:
+        """
+        Add many documents to the index at once.
+
+        Equivalent to calling add_document() for each entry in order, but
+        the NumPy TF arrays grow and are written once for the whole batch,
+        and derived state is invalidated once.
+
+        Args:
+            documents: (doc_id, content) or (doc_id, content, metadata) tuples
+
+        Returns:
+            The indexed Document objects, in input order
+        """
+        docs = []
+        pending = {}  # doc_id -> term frequencies not yet in the arrays
+
+        for doc_id, content, *rest in documents:
+            doc = self._insert_document(doc_id, content, *rest)
+            pending.pop(doc_id, None)  # re-added within the batch
+            pending[doc_id] = doc.term_frequencies
+            docs.append(doc)
+
+        if NUMPY_AVAILABLE:
+            self._append_rows(list(pending.items()))
+        self._index_changed()
+
+        return docs
+
+    def _insert_document(
+        self,
+        doc_id: str,
+        content: str,
+        metadata: Optional[dict] = None
+    ) -> Document:
+        """Index a document everywhere except the NumPy TF arrays."""
         # Remove existing document if present
         if doc_id in self._documents:
             self.remove_document(doc_id)
 
-        # Tokenize
-        tokens = self.tokenize(content)
+        # Tokenize, interning terms so repeated words across documents
+        # share one string object in Document.tokens and the index keys.
+        # Content is tokenized once, so it bypasses the tokenize cache.
+        stop_words = self.stop_words if self.use_stop_words else ()
+        tokens = list(map(
+            sys.intern, _tokenize(content, self.min_term_length, stop_words)
+        ))
         token_counts = Counter(tokens)
         total_tokens = len(tokens)
 
@@ -212,19 +418,18 @@ class TFIDFCalculator:
             metadata=metadata or {}
         )
         self._documents[doc_id] = doc
+        self._doc_order[doc_id] = next(self._order_counter)
 
         # Update index
         self._document_lengths[doc_id] = total_tokens
 
-        for term in set(tokens):
-            # Update term -> doc_id -> tf mapping
-            if term not in self._term_frequencies:
-                self._term_frequencies[term] = {}
-            self._term_frequencies[term][doc_id] = term_frequencies[term]
-
-            # Update document frequency
-            self._document_frequencies[term] = \
-                self._document_frequencies.get(term, 0) + 1
+        term_index = self._term_frequencies
+        doc_freqs = self._document_frequencies
+        for term, tf in term_frequencies.items():
+            # Update term -> doc_id -> tf mapping and document frequency
+            # (both defaultdicts, so new terms need no membership check)
+            term_index[term][doc_id] = tf
+            doc_freqs[term] += 1
 
         return doc
 
@@ -244,7 +449,7 @@ class TFIDFCalculator:
         doc = self._documents[doc_id]
 
         # Update index
-        for term in set(doc.tokens):
+        for term in doc.term_frequencies:
             # Remove from term frequencies
             if term in self._term_frequencies:
                 self._term_frequencies[term].pop(doc_id, None)
@@ -259,10 +464,18 @@ class TFIDFCalculator:
 
         # Remove document
         del self._documents[doc_id]
+        del self._doc_order[doc_id]
         del self._document_lengths[doc_id]
+        self._row_spans.pop(doc_id, None)
+        self._index_changed()
 
         return True
 
+    def _index_changed(self):
+        """Drop everything derived from N and the document frequencies."""
+        self._postings = None
+        self._idf_cache.clear()
+
     def get_document(self, doc_id: str) -> Optional[Document]:
         """Get a document by ID."""
         return self._documents.get(doc_id)
@@ -287,11 +500,16 @@ class TFIDFCalculator:
         Returns:
             IDF value (higher = rarer term)
         """
-        total_docs = len(self._documents)
-        doc_freq = self._document_frequencies.get(term, 0)
+        idf = self._idf_cache.get(term)
+        if idf is None:
+            total_docs = len(self._documents)
+            doc_freq = self._document_frequencies.get(term, 0)
+
+            # Smoothed IDF to prevent division by zero and log(1)=0
+            idf = math.log((total_docs + 1) / (doc_freq + 1))
+            self._idf_cache[term] = idf
 
-        # Smoothed IDF to prevent division by zero and log(1)=0
-        return math.log((total_docs + 1) / (doc_freq + 1))
+        return idf
 
     def calculate_tfidf(self, term: str, doc_id: str) -> float:
         """
@@ -374,37 +592,526 @@ class TFIDFCalculator:
         if not query_tokens:
             return []
 
-        results = []
+        if NUMPY_AVAILABLE:
+            candidates = self._rank_arrays(query_tokens, limit, min_score)
+        else:
+            candidates = self._rank_postings(query_tokens, limit, min_score)
 
-        for doc_id in self._documents:
-            score, term_scores, matched_terms = self.calculate_query_score(
-                query_tokens, doc_id
+        return self._build_results(
+            query_tokens, candidates, limit, min_score,
+            include_excerpts, max_excerpts
+        )
+
+    def search_batch(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        min_score: float = 0.0,
+        include_excerpts: bool = True,
+        max_excerpts: int = 3
+    ) -> list[list[SearchResult]]:
+        """
+        Search several queries against the index at once.
+
+        With SciPy, all queries are scored in one sparse matrix product;
+        otherwise each query runs through search().
+
+        Args:
+            queries: Search query strings
+            limit: Maximum results to return per query
+            min_score: Minimum score threshold
+            include_excerpts: Whether to extract relevant excerpts
+            max_excerpts: Maximum excerpts per result
+
+        Returns:
+            One list of SearchResult objects per query, in query order
+        """
+        sparse = _scipy_sparse() if NUMPY_AVAILABLE else None
+        if sparse is None:
+            return [
+                self.search(query, limit, min_score, include_excerpts, max_excerpts)
+                for query in queries
+            ]
+
+        term_ptr, doc_rows, tfs, idf, _ = self._compile_postings()
+        shape = (len(self._posting_doc_ids), len(self._vocab))
+        matrix = sparse.csc_matrix((tfs, doc_rows, term_ptr), shape=shape)
+
+        tokenized = [self.tokenize(query) for query in queries]
+        query_weights = [
+            self._query_weights(tokens, idf) for tokens in tokenized
+        ]
+
+        rows, cols, data = [], [], []
+        for row, weights in enumerate(query_weights):
+            for term_id, weight in weights:
+                rows.append(row)
+                cols.append(term_id)
+                data.append(weight)
+
+        query_matrix = sparse.csr_matrix(
+            (np.array(data, dtype=np.float32), (rows, cols)),
+            shape=(len(queries), shape[1])
+        )
+        scores = query_matrix.dot(matrix.T).toarray()  # queries x docs
+
+        batch = []
+        for row, query_tokens in enumerate(tokenized):
+            if not query_tokens:
+                batch.append([])
+                continue
+            candidates = self._select_top(
+                scores[row], limit, min_score,
+                self._score_slack(query_weights[row])
             )
+            batch.append(self._build_results(
+                query_tokens, candidates, limit, min_score,
+                include_excerpts, max_excerpts
+            ))
+
+        return batch
 
+    def _build_results(
+        self,
+        query_tokens: list[str],
+        candidates: list[str],
+        limit: int,
+        min_score: float,
+        include_excerpts: bool,
+        max_excerpts: int
+    ) -> list[SearchResult]:
+        """
+        Score candidate documents in full and return the ranked top results.
+
+        Candidates stream through the heap as (score, doc_id) pairs; the
+        per-term breakdown and excerpts are built for the `limit` winners
+        alone.
+        """
+        query_set = frozenset(query_tokens)
+        idf = {term: self.calculate_idf(term) for term in query_set}
+        postings = [
+            (self._term_frequencies.get(term, {}), idf[term])
+            for term in query_tokens
+        ]
+        scored = self._score_candidates(postings, candidates, min_score)
+
+        # Top results by score descending (ties keep candidate order)
+        results = []
+        for score, doc_id in heapq.nlargest(limit, scored, key=itemgetter(0)):
+            term_scores = {}
+            matched_terms = []
+            for term, (doc_tfs, term_idf) in zip(query_tokens, postings):
+                term_score = doc_tfs.get(doc_id, 0.0) * term_idf
+                term_scores[term] = term_score
+                if term_score > 0:
+                    matched_terms.append(term)
+
+            excerpts = []
+            if include_excerpts:
+                excerpts = self._extract_excerpts(
+                    doc_id, query_set, max_excerpts
+                )
+
+            results.append(SearchResult(
+                doc_id=doc_id,
+                score=score,
+                matched_terms=matched_terms,
+                term_scores=term_scores,
+                excerpts=excerpts
+            ))
+
+        return results
+
+    @staticmethod
+    def _score_candidates(
+        postings: list[tuple[dict[str, float], float]],
+        candidates: list[str],
+        min_score: float
+    ):
+        """Yield (score, doc_id) for each candidate scoring at least min_score."""
+        for doc_id in candidates:
+            score = 0.0
+            for doc_tfs, term_idf in postings:
+                score += doc_tfs.get(doc_id, 0.0) * term_idf
             if score >= min_score:
-                excerpts = []
-                if include_excerpts:
-                    excerpts = self._extract_excerpts(
-                        doc_id, query_tokens, max_excerpts
-                    )
+                yield score, doc_id
+
+    def _append_rows(self, rows: list[tuple[str, dict[str, float]]]):
+        """
+        Append documents' term ids and TFs to the parallel arrays.
 
-                results.append(SearchResult(
-                    doc_id=doc_id,
-                    score=score,
-                    matched_terms=matched_terms,
-                    term_scores=term_scores,
-                    excerpts=excerpts
-                ))
+        Each (doc_id, term_frequencies) row takes the next span. TFs are
+        rounded to the nearest multiple of 1 / _TF_SCALE, and never down to
+        zero, so a matched term always adds a positive score.
+        """
+        added = sum(len(term_frequencies) for _, term_frequencies in rows)
+        if self._nnz + added > len(self._tfs):
+            self._compact_rows(added)
+
+        vocab = self._vocab
+        term_ids = []
+        tfs = []
+        start = self._nnz
+        for doc_id, term_frequencies in rows:
+            row_start = start + len(term_ids)
+            term_ids.extend(
+                vocab.setdefault(term, len(vocab)) for term in term_frequencies
+            )
+            tfs.extend(term_frequencies.values())
+            self._row_spans[doc_id] = (row_start, start + len(term_ids))
+        end = start + len(term_ids)
+
+        self._term_ids[start:end] = term_ids
+        self._tfs[start:end] = np.maximum(
+            np.rint(np.array(tfs, dtype=np.float64) * _TF_SCALE), 1
+        )
+        self._nnz = end
+
+    def _gather_spans(self, doc_ids: list[str]):
+        """
+        Gather the given documents' spans into new contiguous arrays.
+
+        Returns (term_ids, tfs, lengths): the documents' (term id, tf)
+        pairs back to back in doc_ids order, and each document's pair
+        count. The stored arrays are only read.
+        """
+        spans = np.array(
+            [self._row_spans[doc_id] for doc_id in doc_ids],
+            dtype=np.int64
+        ).reshape(-1, 2)
+        lengths = spans[:, 1] - spans[:, 0]
+        indptr = np.zeros(len(doc_ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+
+        gather = np.arange(indptr[-1]) + np.repeat(
+            spans[:, 0] - indptr[:-1], lengths
+        )
+        return self._term_ids[gather], self._tfs[gather], lengths
+
+    def _compact_rows(self, extra: int):
+        """
+        Rebuild the TF arrays with room for `extra` more pairs.
+
+        Runs when an append outgrows the arrays, which have to be copied
+        anyway, and drops the spans left behind by removed documents.
+        """
+        doc_ids = list(self._row_spans)
+        term_ids, tfs, lengths = self._gather_spans(doc_ids)
+        live = len(tfs)
+        capacity = max(live + extra, 2 * live)
+
+        self._term_ids = np.empty(capacity, dtype=term_ids.dtype)
+        self._term_ids[:live] = term_ids
+        self._tfs = np.empty(capacity, dtype=tfs.dtype)
+        self._tfs[:live] = tfs
+        self._nnz = live
+
+        bounds = np.concatenate(([0], np.cumsum(lengths))).tolist()
+        self._row_spans = {
+            doc_id: (bounds[i], bounds[i + 1])
+            for i, doc_id in enumerate(doc_ids)
+        }
+
+    def _compile_postings(self):
+        """
+        Build the term-major postings arrays from the per-document spans.
+
+        Live spans are gathered in document order into new arrays, so
+        searching never writes the TF store. A stable sort by term id then
+        lays out each term's (doc row, tf) postings as one contiguous
+        slice, with doc rows in insertion order. The slice lengths are the
+        document frequencies, which give the IDF of every term in one
+        vectorized step, and a reduceat over the slices gives each term's
+        largest TF.
+        """
+        if self._postings is None:
+            doc_ids = list(self._documents)
+            term_ids, doc_tfs, lengths = self._gather_spans(doc_ids)
+
+            doc_rows = np.repeat(np.arange(len(doc_ids), dtype=np.int32), lengths)
+            order = np.argsort(term_ids, kind="stable")
+            term_ptr = np.zeros(len(self._vocab) + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(term_ids, minlength=len(self._vocab)),
+                out=term_ptr[1:]
+            )
+
+            doc_freqs = np.diff(term_ptr)
+            idf = np.log(len(doc_ids) + 1) - np.log1p(doc_freqs)
+
+            tfs = doc_tfs[order]
+            max_tfs = np.zeros(len(self._vocab), dtype=np.uint16)
+            present = np.flatnonzero(doc_freqs)
+            if len(present):
+                max_tfs[present] = np.maximum.reduceat(tfs, term_ptr[present])
+
+            self._posting_doc_ids = doc_ids
+            self._postings = (term_ptr, doc_rows[order], tfs, idf, max_tfs)
+
+        return self._postings
+
+    def _query_weights(
+        self,
+        query_tokens: list[str],
+        idf: "np.ndarray"
+    ) -> list[tuple[int, float]]:
+        """
+        Map indexed query terms to (term id, count * IDF / _TF_SCALE) pairs.
+
+        The scale is folded into the weights so that ranking multiplies the
+        quantized TFs directly.
+        """
+        weights = []
+        for term, count in Counter(query_tokens).items():
+            term_id = self._vocab.get(term)
+            if term_id is not None:
+                weights.append(
+                    (term_id, count * float(idf[term_id]) / _TF_SCALE)
+                )
+        return weights
+
+    @staticmethod
+    def _score_slack(weights: list[tuple[int, float]]) -> float:
+        """
+        Bound the ranking score error of a query.
+
+        Quantizing a TF (at most 1) is off by less than 1 / _TF_SCALE, and
+        the float32 products and sums add a relative error per term.
+        """
+        total = sum(weight for _, weight in weights) * _TF_SCALE
+        return total * (1 / _TF_SCALE + (len(weights) + 2) * 2.0 ** -23)
+
+    def _rank_postings(
+        self,
+        query_tokens: list[str],
+        limit: int,
+        min_score: float
+    ) -> list[str]:
+        """
+        Select the top `limit` documents from the query terms' postings.
+
+        Scores accumulate only over the postings of the query terms, so the
+        work is proportional to their lengths rather than the index size.
+        Every other document scores zero and, when min_score allows it,
+        pads the result in insertion order. Ties are broken by insertion
+        order, as in the final stable sort.
+
+        Args:
+            query_tokens: Tokenized query terms
+            limit: Maximum results to return
+            min_score: Minimum score threshold
+
+        Returns:
+            Candidate document IDs
+        """
+        if limit <= 0:
+            return []
 
-        # Sort by score descending
-        results.sort(key=lambda x: x.score, reverse=True)
+        idf = {term: self.calculate_idf(term) for term in set(query_tokens)}
+        scores: defaultdict[str, float] = defaultdict(float)
+        for term in query_tokens:
+            postings = self._term_frequencies.get(term)
+            if not postings:
+                continue
+            weight = idf[term]
+            for doc_id, tf in postings.items():
+                scores[doc_id] += tf * weight
+
+        order = self._doc_order
+        ranked = heapq.nsmallest(limit, (
+            (-score, order[doc_id], doc_id)
+            for doc_id, score in scores.items()
+            if score > 0 and score >= min_score
+        ))
+        candidates = [doc_id for _, _, doc_id in ranked]
+
+        if min_score <= 0 and len(candidates) < limit:
+            for doc_id in self._documents:
+                if not scores.get(doc_id):
+                    candidates.append(doc_id)
+                    if len(candidates) == limit:
+                        break
+
+        return candidates
+
+    def _rank_arrays(
+        self,
+        query_tokens: list[str],
+        limit: int,
+        min_score: float
+    ) -> list[str]:
+        """
+        Select candidate documents by scoring postings slices with NumPy.
+
+        Each query term adds tf * weight into a float32 score vector over
+        its postings slice, so only those postings are touched. Terms go in
+        decreasing order of their best possible contribution (largest TF
+        times weight), MaxScore style: once the contributions left cannot
+        lift a document past the current `limit`-th best score, documents
+        still at zero are out of reach. The remaining terms then only
+        update the documents that can still make the cut, found by binary
+        search in each postings slice instead of a full scan.
+
+        Args:
+            query_tokens: Tokenized query terms
+            limit: Maximum results to return
+            min_score: Minimum score threshold
 
-        return results[:limit]
+        Returns:
+            Candidate document IDs in insertion order
+        """
+        postings = self._compile_postings()
+        term_ptr, doc_rows, tfs, idf, max_tfs = postings
+        weights = self._query_weights(query_tokens, idf)
+        slack = self._score_slack(weights)
+
+        bounds = [float(max_tfs[term_id]) * weight for term_id, weight in weights]
+        order = sorted(range(len(weights)), key=bounds.__getitem__, reverse=True)
+        weights = [weights[k] for k in order]
+        remaining = [bounds[k] for k in order]
+        postings_left = [
+            int(term_ptr[term_id + 1] - term_ptr[term_id])
+            for term_id, _ in weights
+        ]
+        for k in range(len(remaining) - 2, -1, -1):
+            remaining[k] += remaining[k + 1]  # suffix sums
+            postings_left[k] += postings_left[k + 1]
+
+        scores = np.zeros(len(self._posting_doc_ids), dtype=np.float32)
+        scored = len(weights)
+        reachable = None
+        threshold = 0.0  # a score at least `limit` documents have reached
+        for k in range(1, len(weights)):
+            term_id = weights[k - 1][0]
+            self._score_terms(postings, weights[k - 1:k], scores)
+
+            # The limit-th best among the documents this term touched is
+            # never above the limit-th best overall; it is only worth
+            # finding while more postings than that are left to scan
+            touched = scores[doc_rows[term_ptr[term_id]:term_ptr[term_id + 1]]]
+            if 0 < limit <= len(touched) <= postings_left[k]:
+                kth = len(touched) - limit
+                threshold = max(
+                    threshold, float(np.partition(touched, kth)[kth])
+                )
+            if remaining[k] + 2 * slack < threshold:
+                scored = k
+                break
+        else:
+            self._score_terms(postings, weights[-1:], scores)
+
+        if scored < len(weights):
+            reach = remaining[scored] + 2 * slack
+            reachable = np.flatnonzero(
+                (scores > 0) & (scores + reach >= threshold)
+            )
+            for term_id, weight in weights[scored:]:
+                start, end = term_ptr[term_id], term_ptr[term_id + 1]
+                if start == end:
+                    continue
+                rows = doc_rows[start:end]
+                positions = np.minimum(
+                    np.searchsorted(rows, reachable), len(rows) - 1
+                )
+                hits = rows[positions] == reachable
+                scores[reachable[hits]] += (
+                    tfs[start + positions[hits]] * np.float32(weight)
+                )
+
+        return self._select_top(scores, limit, min_score, slack, reachable)
+
+    def _score_terms(
+        self,
+        postings: tuple,
+        weights: list[tuple[int, float]],
+        scores
+    ):
+        """
+        Add each (term id, weight) pair's tf * weight over its postings.
+
+        With use_numba the accumulation runs in one compiled kernel, split
+        across threads once the terms cover enough postings; otherwise each
+        term is one fancy-indexed NumPy add.
+        """
+        term_ptr, doc_rows, tfs, _, _ = postings
+        kernels = _numba_kernels() if self.use_numba else None
+        if kernels is not None:
+            score_postings, score_postings_parallel, get_num_threads = kernels
+            term_ids = np.array(
+                [term_id for term_id, _ in weights], dtype=np.int64
+            )
+            term_weights = np.array(
+                [weight for _, weight in weights], dtype=np.float32
+            )
+            n_postings = int(
+                (term_ptr[term_ids + 1] - term_ptr[term_ids]).sum()
+            )
+            n_threads = get_num_threads()
+            if n_threads > 1 and n_postings >= _PARALLEL_MIN_POSTINGS:
+                score_postings_parallel(
+                    term_ids, term_weights, term_ptr, doc_rows, tfs, scores,
+                    n_threads
+                )
+            else:
+                score_postings(
+                    term_ids, term_weights, term_ptr, doc_rows, tfs, scores
+                )
+        else:
+            for term_id, weight in weights:
+                start, end = term_ptr[term_id], term_ptr[term_id + 1]
+                scores[doc_rows[start:end]] += (
+                    tfs[start:end] * np.float32(weight)
+                )
+
+    def _select_top(
+        self,
+        scores,
+        limit: int,
+        min_score: float,
+        slack: float = 0.0,
+        rows=None
+    ) -> list[str]:
+        """
+        Pick the doc rows that can reach the exact top `limit` results.
+
+        `scores` may differ from the exact float64 scores by up to `slack`,
+        so every row within 2 * slack of the approximate cutoff is kept and
+        _build_results() ranks them exactly. A zero score is always exact
+        (no term matched), and only the first `limit` zero-score rows in
+        insertion order can make the cut.
+
+        Args:
+            scores: Approximate score per doc row
+            limit: Maximum results to return
+            min_score: Minimum score threshold
+            slack: Maximum absolute error of `scores`
+            rows: Ascending doc rows known to hold the top results, if any
+                are; only these are considered (default: every row)
+
+        Returns:
+            Candidate document IDs in insertion order
+        """
+        if limit <= 0:
+            return []
+
+        if rows is None:
+            selected = np.flatnonzero(scores >= min_score - slack)
+        else:
+            selected = rows[scores[rows] >= min_score - slack]
+        if len(selected) > limit:
+            cutoff = np.partition(scores[selected], -limit)[-limit]
+            selected = selected[scores[selected] >= cutoff - 2 * slack]
+
+        zero = scores[selected] == 0
+        if np.count_nonzero(zero) > limit:
+            selected = np.union1d(selected[~zero], selected[zero][:limit])
+
+        return [self._posting_doc_ids[i] for i in selected]
 
     def _extract_excerpts(
         self,
         doc_id: str,
-        query_tokens: list[str],
+        query_set: frozenset[str],
         max_excerpts: int = 3
     ) -> list[str]:
         """
@@ -412,7 +1119,7 @@ class TFIDFCalculator:
 
         Args:
             doc_id: Document ID
-            query_tokens: Query terms to match
+            query_set: Distinct query terms to match
             max_excerpts: Maximum excerpts to return
 
         Returns:
@@ -422,21 +1129,23 @@ class TFIDFCalculator:
         if not doc:
             return []
 
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', doc.content)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+        # Split into sentences and tokenize them once per document
+        if doc.sentence_index is None:
+            sentences = _SENT_RE.split(doc.content)
+            sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+            doc.sentence_index = [
+                (sentence, frozenset(self.tokenize(sentence)))
+                for sentence in sentences
+            ]
 
-        if not sentences:
+        if not doc.sentence_index:
             return []
 
         # Score sentences by query term presence
-        query_set = set(query_tokens)
-        scored = []
-
-        for sentence in sentences:
-            sentence_tokens = set(self.tokenize(sentence))
-            match_count = len(sentence_tokens & query_set)
-            scored.append((sentence, match_count))
+        scored = [
+            (sentence, len(sentence_tokens & query_set))
+            for sentence, sentence_tokens in doc.sentence_index
+        ]
 
         # Sort by match count and return top excerpts
         scored.sort(key=lambda x: x[1], reverse=True)
@@ -485,21 +1194,24 @@ class TFIDFCalculator:
         Returns:
             Summary string
         """
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+        # Split into sentences, keeping every piece: together the pieces
+        # hold exactly the tokens of the whole content
+        pieces = _SENT_RE.split(content)
+        kept = [i for i, piece in enumerate(pieces) if len(piece.strip()) > 20]
+        sentences = [pieces[i].strip() for i in kept]
 
         if len(sentences) <= max_sentences:
             return ". ".join(sentences) + "." if sentences else ""
 
-        # Calculate term frequencies for entire document
-        all_tokens = self.tokenize(content)
-        term_freq = Counter(all_tokens)
+        # Tokenize each piece once; the whole-document term frequencies
+        # and the sentence scores both come from these token lists
+        piece_tokens = [self.tokenize(piece) for piece in pieces]
+        term_freq = Counter(itertools.chain.from_iterable(piece_tokens))
 
         # Score each sentence
         scored = []
         for index, sentence in enumerate(sentences):
-            sentence_tokens = self.tokenize(sentence)
+            sentence_tokens = piece_tokens[kept[index]]
 
             # Score by term frequency
             score = sum(term_freq.get(t, 0) for t in sentence_tokens)
@@ -16,11 +16,15 @@ Usage:
 """
 
 import argparse
+import asyncio
 import gc
+import hashlib
 import json
 import os
+import sqlite3
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -30,13 +34,14 @@ import numpy as np
 
 # Conditional imports for different providers
 try:
+    import torch
     from sentence_transformers import SentenceTransformer, util
     HAS_SENTENCE_TRANSFORMERS = True
 except ImportError:
     HAS_SENTENCE_TRANSFORMERS = False
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
     HAS_OPENAI = True
 except ImportError:
     HAS_OPENAI = False
@@ -47,8 +52,23 @@ try:
 except ImportError:
     HAS_OLLAMA = False
 
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+try:
+    import fcntl  # POSIX only; without it the dimensions cache is unlocked
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# Slotted instances drop the per-object __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class BenchmarkResult:
     """Results from a single benchmark run."""
     model_name: str
@@ -69,6 +89,13 @@ class BenchmarkResult:
     model_memory_mb: float
     peak_memory_mb: float
 
+    # Latency tail (p95, milliseconds)
+    latency_single_p95_ms: Optional[float] = None
+    latency_batch_32_p95_ms: Optional[float] = None
+
+    # Batches in flight during the throughput runs (1: one after another)
+    throughput_concurrency: int = 1
+
     # Quality metrics (optional)
     similarity_accuracy: Optional[float] = None
     retrieval_mrr: Optional[float] = None
@@ -79,15 +106,20 @@ class BenchmarkResult:
     notes: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BenchmarkConfig:
     """Configuration for benchmark runs."""
     warmup_iterations: int = 3
-    latency_iterations: int = 10
+    latency_iterations: int = 30  # upper bound per batch size
+    latency_min_iterations: int = 3
+    latency_time_budget: float = 2.0  # seconds; stop adding iterations after it
     throughput_samples: int = 1000
     batch_sizes: List[int] = None
     device: str = "cpu"
+    dtype: Optional[str] = None  # fp32, fp16 or bf16; None picks by device
     include_quality: bool = True
+    embedding_cache: Optional[str] = None  # SQLite path; None keeps it in memory
+    dimensions: Optional[int] = None  # OpenAI text-embedding-3 output size
 
     def __post_init__(self):
         if self.batch_sizes is None:
@@ -125,6 +157,54 @@ RETRIEVAL_QUERIES = [
 ]
 
 
+DIMENSIONS_CACHE = Path.home() / ".cache" / "embedding_benchmark" / "dims.json"
+
+
+def cached_dimensions(
+    key: str,
+    probe: Callable[[], int],
+    path: Path = DIMENSIONS_CACHE,
+    refresh: bool = False
+) -> int:
+    """
+    Return the embedding size recorded for key, calling probe on a miss.
+
+    Sizes rarely change per model, so API providers only pay the probe
+    request the first time a model is benchmarked on this machine.
+    refresh=True calls probe and overwrites the recorded size.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a+") as f:
+            if HAS_FCNTL:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    dims = json.loads(f.read() or "{}")
+                except json.JSONDecodeError:
+                    dims = {}
+
+                if refresh or key not in dims:
+                    dims[key] = probe()
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(dims, f, indent=2)
+                return dims[key]
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    except OSError:
+        return probe()
+
+
+def checked_dimensions(key: str, cached: int, actual: int) -> int:
+    """Return actual, rewriting key's cache entry if it recorded another size."""
+    if actual != cached:
+        cached_dimensions(key, lambda: actual, refresh=True)
+    return actual
+
+
 def get_memory_usage() -> float:
     """Get current process memory usage in MB."""
     try:
@@ -134,32 +214,158 @@ def get_memory_usage() -> float:
         return 0.0
 
 
-def generate_test_texts(n: int) -> List[str]:
-    """Generate test texts for benchmarking."""
-    templates = [
-        "This is document number {} containing sample text for embedding.",
-        "Document {} discusses various topics related to machine learning.",
-        "The {} entry in our corpus covers software engineering practices.",
-        "Entry number {} provides information about data processing.",
-        "Text {} explores concepts in natural language processing.",
+TEST_VOCABULARY = tuple((
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua enim ad minim veniam "
+    "quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo "
+    "consequat duis aute irure in reprehenderit voluptate velit esse cillum "
+    "fugiat nulla pariatur excepteur sint occaecat cupidatat non proident "
+    "sunt culpa qui officia deserunt mollit anim id est laborum"
+).split())
+
+
+def generate_test_texts(n: int, seed: int = 0) -> List[str]:
+    """
+    Generate test texts for benchmarking.
+
+    Texts are 8-40 random words, so no two timed batches repeat and
+    lengths vary the way real documents do. The fixed seed keeps the
+    dataset identical across models and runs.
+    """
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(8, 41, size=n)
+    words = rng.choice(TEST_VOCABULARY, size=int(lengths.sum()))
+    bounds = np.cumsum(lengths)
+    return [
+        " ".join(words[end - length:end]).capitalize() + "."
+        for length, end in zip(lengths, bounds)
     ]
-    return [templates[i % len(templates)].format(i) for i in range(n)]
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """Copy embeddings into a contiguous float32 array of unit-length rows."""
+    out = np.array(embeddings, dtype=np.float32, order="C")
+    np.divide(out, np.linalg.norm(out, axis=1, keepdims=True), out=out)
+    return out
+
+
+def cosine_similarity_pairs(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cosine similarity of each row of a with the same row of b."""
+    if HAS_SIMSIMD:
+        distances = simsimd.cosine(np.ascontiguousarray(a), np.ascontiguousarray(b))
+        return 1 - np.asarray(distances)
+
+    return np.einsum("pd,pd->p", normalize_rows(a), normalize_rows(b))
+
+
+def cosine_similarity_matrix(
+    a: np.ndarray,
+    b: np.ndarray,
+    normalized: bool = False
+) -> np.ndarray:
+    """
+    Cosine similarity of every row of a with every row of b.
+
+    Pass normalized=True when both inputs come from normalize_rows() to
+    skip normalizing them again.
+    """
+    if HAS_SIMSIMD:
+        distances = simsimd.cdist(
+            np.ascontiguousarray(a), np.ascontiguousarray(b), metric="cosine"
+        )
+        return 1 - np.asarray(distances)
+
+    if not normalized:
+        a, b = normalize_rows(a), normalize_rows(b)
+    return a @ b.T
+
+
+class CachedEncoder:
+    """
+    Encoder wrapper that caches embeddings in SQLite.
+
+    Entries are keyed by (model key, SHA-256 of the text); only cache misses
+    reach the wrapped encoder, in one batch. Used for warmup and quality
+    phases, never for timed iterations.
+    """
+
+    def __init__(
+        self,
+        encoder: Callable[[List[str]], np.ndarray],
+        model_key: str,
+        path: str = ":memory:"
+    ):
+        self.encoder = encoder
+        self.model_key = model_key
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT, text_hash TEXT, dtype TEXT, embedding BLOB, "
+            "PRIMARY KEY (model, text_hash))"
+        )
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        hashes = [hashlib.sha256(t.encode("utf-8")).hexdigest() for t in texts]
+        found = {}
+        for text_hash in set(hashes):
+            row = self.conn.execute(
+                "SELECT dtype, embedding FROM embeddings "
+                "WHERE model = ? AND text_hash = ?",
+                (self.model_key, text_hash)
+            ).fetchone()
+            if row:
+                found[text_hash] = np.frombuffer(row[1], dtype=row[0])
+
+        misses = {h: t for h, t in zip(hashes, texts) if h not in found}
+        if misses:
+            embeddings = np.asarray(self.encoder(list(misses.values())))
+            for text_hash, embedding in zip(misses, embeddings):
+                found[text_hash] = embedding
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                [
+                    (self.model_key, h, e.dtype.str, e.tobytes())
+                    for h, e in zip(misses, embeddings)
+                ]
+            )
+            self.conn.commit()
+
+        return np.stack([found[h] for h in hashes])
+
+    def close(self):
+        self.conn.close()
 
 
 class SentenceTransformerBenchmark:
     """Benchmark wrapper for sentence-transformers models."""
 
-    def __init__(self, model_name: str, device: str = "cpu"):
+    def __init__(
+        self,
+        model_name: str,
+        device: str = "cpu",
+        dtype: Optional[str] = None
+    ):
         if not HAS_SENTENCE_TRANSFORMERS:
             raise ImportError("sentence-transformers not installed")
 
         self.model_name = model_name
         self.device = device
         self.model = SentenceTransformer(model_name, device=device)
+
+        # Half precision on accelerators; CPU kernels stay in fp32
+        self.dtype = dtype or ("fp32" if device == "cpu" else "fp16")
+        if self.dtype == "fp16":
+            self.model.half()
+        elif self.dtype == "bf16":
+            self.model.to(dtype=torch.bfloat16)
         self.dimensions = self.model.get_sentence_embedding_dimension()
 
-    def encode(self, texts: List[str]) -> np.ndarray:
-        return self.model.encode(texts, convert_to_numpy=True)
+    def encode(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        # One forward pass per call by default, so a benchmark batch of 128
+        # is not silently split into the model's default batches of 32
+        return self.model.encode(
+            texts, batch_size=batch_size or len(texts), convert_to_numpy=True
+        )
 
     def encode_single(self, text: str) -> np.ndarray:
         return self.model.encode([text], convert_to_numpy=True)[0]
@@ -168,144 +374,270 @@ class SentenceTransformerBenchmark:
 class OpenAIBenchmark:
     """Benchmark wrapper for OpenAI embeddings."""
 
-    def __init__(self, model_name: str = "text-embedding-3-small"):
+    def __init__(
+        self,
+        model_name: str = "text-embedding-3-small",
+        dimensions: Optional[int] = None,
+        max_concurrent: int = 10
+    ):
         if not HAS_OPENAI:
             raise ImportError("openai not installed")
 
         self.model_name = model_name
+        self.max_concurrent = max_concurrent
         self.client = OpenAI()
 
+        # text-embedding-3 models truncate server-side when asked;
+        # older models reject the parameter, so only send it when set
+        self.request_args = {"model": model_name}
+        if dimensions is not None:
+            self.request_args["dimensions"] = dimensions
+
         # Get dimensions
+        self._dimensions_key = f"openai:{model_name}:{dimensions}"
+        self.dimensions = cached_dimensions(
+            self._dimensions_key, self._probe_dimensions
+        )
+
+    def _probe_dimensions(self) -> int:
         test_response = self.client.embeddings.create(
             input="test",
-            model=model_name
+            **self.request_args
         )
-        self.dimensions = len(test_response.data[0].embedding)
+        return len(test_response.data[0].embedding)
 
     def encode(self, texts: List[str]) -> np.ndarray:
-        response = self.client.embeddings.create(input=texts, model=self.model_name)
-        sorted_data = sorted(response.data, key=lambda x: x.index)
-        return np.array([d.embedding for d in sorted_data])
+        response = self.client.embeddings.create(input=texts, **self.request_args)
+        return self._to_array(response.data)
+
+    def _to_array(self, data) -> np.ndarray:
+        if data:
+            self.dimensions = checked_dimensions(
+                self._dimensions_key, self.dimensions, len(data[0].embedding)
+            )
+
+        # Rows are written straight into place by index, no sort or list copy
+        out = np.empty((len(data), self.dimensions), dtype=np.float32)
+        for d in data:
+            out[d.index] = d.embedding
+        return out
 
     def encode_single(self, text: str) -> np.ndarray:
-        response = self.client.embeddings.create(input=[text], model=self.model_name)
+        response = self.client.embeddings.create(input=[text], **self.request_args)
         return np.array(response.data[0].embedding)
 
+    def encode_many(
+        self,
+        batches: List[List[str]],
+        max_concurrent: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """
+        Encode batches with up to max_concurrent requests in flight
+        (default: self.max_concurrent).
+        """
+        return asyncio.run(self.aencode_many(batches, max_concurrent))
+
+    async def aencode_many(
+        self,
+        batches: List[List[str]],
+        max_concurrent: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """Async encode_many(); results are in batch order."""
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent)
+
+        # One client per event loop: its connection pool is bound to the loop
+        async with AsyncOpenAI() as client:
+            async def bounded_encode(batch: List[str]) -> np.ndarray:
+                async with semaphore:
+                    response = await client.embeddings.create(
+                        input=batch, **self.request_args
+                    )
+                return self._to_array(response.data)
+
+            return await asyncio.gather(*[bounded_encode(b) for b in batches])
+
 
 class OllamaBenchmark:
     """Benchmark wrapper for Ollama embeddings."""
 
-    def __init__(self, model_name: str = "nomic-embed-text"):
+    def __init__(self, model_name: str = "nomic-embed-text", max_workers: int = 8):
         if not HAS_OLLAMA:
             raise ImportError("ollama not installed")
 
         self.model_name = model_name
 
+        # The ollama client blocks per request, so batches fan out over threads
+        self.pool = ThreadPoolExecutor(max_workers=max_workers)
+
         # Get dimensions
-        test_response = ollama.embeddings(model=model_name, prompt="test")
-        self.dimensions = len(test_response["embedding"])
+        self._dimensions_key = f"ollama:{model_name}"
+        self.dimensions = cached_dimensions(
+            self._dimensions_key, lambda: len(self._embed("test"))
+        )
 
     def encode(self, texts: List[str]) -> np.ndarray:
-        embeddings = []
-        for text in texts:
-            response = ollama.embeddings(model=self.model_name, prompt=text)
-            embeddings.append(response["embedding"])
-        return np.array(embeddings)
+        embeddings = self.pool.map(self._embed, texts)
+        first = next(embeddings, None)
+        if first is None:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+
+        self.dimensions = checked_dimensions(
+            self._dimensions_key, self.dimensions, len(first)
+        )
+        out = np.empty((len(texts), self.dimensions), dtype=np.float32)
+        out[0] = first
+        for i, embedding in enumerate(embeddings, 1):
+            out[i] = embedding
+        return out
+
+    def _embed(self, text: str) -> List[float]:
+        return ollama.embeddings(model=self.model_name, prompt=text)["embedding"]
 
     def encode_single(self, text: str) -> np.ndarray:
         response = ollama.embeddings(model=self.model_name, prompt=text)
         return np.array(response["embedding"])
 
+    def close(self):
+        self.pool.shutdown()
+
 
 def benchmark_latency(
     encoder: Callable[[List[str]], np.ndarray],
     texts: List[str],
+    batch_size: Optional[int] = None,
     warmup: int = 3,
-    iterations: int = 10
-) -> float:
-    """Measure average latency in milliseconds."""
-    # Warmup
-    for _ in range(warmup):
-        encoder(texts)
+    iterations: int = 10,
+    warmup_encoder: Optional[Callable[[List[str]], np.ndarray]] = None,
+    min_iterations: int = 3,
+    time_budget: float = 2.0
+) -> tuple:
+    """
+    Measure latency in milliseconds; returns (median, p95).
+
+    Runs at least min_iterations and at most iterations measurements,
+    stopping once time_budget seconds have been spent, so fast calls get
+    many samples and slow batches only a few.
+
+    Each measurement encodes the next batch_size texts from texts (all of
+    them when batch_size is None), wrapping around, so providers can't
+    serve repeated inputs from a cache.
+    """
+    batch_size = batch_size or len(texts)
+    batches = [
+        [texts[(start + i) % len(texts)] for i in range(batch_size)]
+        for start in range(0, len(texts), batch_size)
+    ]
+
+    # Warmup. The first call always reaches the raw encoder, so cold-start
+    # cost stays out of the samples even when warmup_encoder is a
+    # CachedEncoder already holding these texts; the rest go through it
+    for i in range(warmup):
+        (encoder if i == 0 else warmup_encoder or encoder)(batches[0])
 
-    # Measure
+    # Measure with the collector paused so its pauses don't land in samples
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
     times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        encoder(texts)
-        elapsed = (time.perf_counter() - start) * 1000  # ms
-        times.append(elapsed)
+    deadline = time.perf_counter_ns() + int(time_budget * 1e9)
+    try:
+        while len(times) < iterations and (
+            len(times) < min_iterations or time.perf_counter_ns() < deadline
+        ):
+            batch = batches[(len(times) + 1) % len(batches)]
+            start = time.perf_counter_ns()
+            encoder(batch)
+            times.append(time.perf_counter_ns() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
 
-    return np.mean(times)
+    times_ms = np.array(times) / 1e6
+    return float(np.median(times_ms)), float(np.percentile(times_ms, 95))
 
 
 def benchmark_throughput(
     encoder: Callable[[List[str]], np.ndarray],
     num_samples: int,
-    batch_size: int
+    batch_size: int,
+    encode_many: Optional[Callable[[List[List[str]]], List[np.ndarray]]] = None
 ) -> float:
-    """Measure throughput in documents per second."""
-    texts = generate_test_texts(num_samples)
+    """
+    Measure throughput in documents per second.
+
+    Batches are encoded one after another, or all through `encode_many`
+    when given, so providers that accept concurrent requests (API
+    endpoints) are measured at their concurrent throughput.
+    """
+    # A different seed from the latency texts, so nothing is re-encoded
+    texts = generate_test_texts(num_samples, seed=1)
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
 
     start = time.perf_counter()
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i:i + batch_size]
-        encoder(batch)
+    if encode_many is not None:
+        encode_many(batches)
+    else:
+        for batch in batches:
+            encoder(batch)
     elapsed = time.perf_counter() - start
 
     return num_samples / elapsed
 
 
 def evaluate_similarity_quality(
-    encode_single: Callable[[str], np.ndarray],
+    encoder: Callable[[List[str]], np.ndarray],
     pairs: List[tuple] = SIMILARITY_PAIRS
 ) -> float:
     """Evaluate similarity quality on test pairs."""
-    correct = 0
-    total = len(pairs)
-
-    for text1, text2 in pairs:
-        emb1 = encode_single(text1)
-        emb2 = encode_single(text2)
-
-        # Normalize
-        emb1 = emb1 / np.linalg.norm(emb1)
-        emb2 = emb2 / np.linalg.norm(emb2)
+    # Encode both sides of every pair in one batch
+    embeddings = encoder([text for pair in pairs for text in pair])
 
-        similarity = np.dot(emb1, emb2)
+    similarities = cosine_similarity_pairs(embeddings[0::2], embeddings[1::2])
 
-        # Expect high similarity for paired texts
-        if similarity > 0.5:
-            correct += 1
+    # Expect high similarity for paired texts
+    correct = int((similarities > 0.5).sum())
 
-    return correct / total
+    return correct / len(pairs)
 
 
 def evaluate_retrieval_quality(
     encoder: Callable[[List[str]], np.ndarray],
     corpus: List[str] = RETRIEVAL_CORPUS,
-    queries: List[tuple] = RETRIEVAL_QUERIES
+    queries: List[tuple] = RETRIEVAL_QUERIES,
+    block_size: int = 4096
 ) -> float:
-    """Evaluate retrieval quality using MRR (Mean Reciprocal Rank)."""
-    corpus_embeddings = encoder(corpus)
-    corpus_embeddings = corpus_embeddings / np.linalg.norm(
-        corpus_embeddings, axis=1, keepdims=True
-    )
-
-    reciprocal_ranks = []
-
-    for query, expected_idx in queries:
-        query_embedding = encoder([query])[0]
-        query_embedding = query_embedding / np.linalg.norm(query_embedding)
+    """
+    Evaluate retrieval quality using MRR (Mean Reciprocal Rank).
+
+    The corpus is scored in blocks of block_size rows, so memory for
+    similarities stays at (queries x block_size) however large the corpus.
+    """
+    # Normalized once into contiguous float32, so blocks are plain views
+    corpus_embeddings = normalize_rows(encoder(corpus))
+    query_embeddings = normalize_rows(encoder([query for query, _ in queries]))
+
+    expected = np.array([expected_idx for _, expected_idx in queries])
+    # Same kernel as the blocks below, so ties compare equal bit for bit
+    targets = cosine_similarity_matrix(
+        query_embeddings, corpus_embeddings[expected], normalized=True
+    ).diagonal()
+    rows = np.arange(len(queries))
+
+    # Rank of the expected document: 1 + number of documents scoring higher
+    ranks = np.ones(len(queries), dtype=np.int64)
+    for start in range(0, len(corpus_embeddings), block_size):
+        end = start + block_size
+        block = cosine_similarity_matrix(
+            query_embeddings, corpus_embeddings[start:end], normalized=True
+        )
+        higher = block > targets[:, None]
 
-        similarities = corpus_embeddings @ query_embedding
-        ranked_indices = np.argsort(similarities)[::-1]
+        # The expected document never outranks itself, whatever the rounding
+        in_block = (expected >= start) & (expected < end)
+        higher[rows[in_block], expected[in_block] - start] = False
 
-        # Find rank of expected document
-        rank = np.where(ranked_indices == expected_idx)[0][0] + 1
-        reciprocal_ranks.append(1 / rank)
+        ranks += np.count_nonzero(higher, axis=1)
 
-    return np.mean(reciprocal_ranks)
+    return np.mean(1 / ranks)
 
 
 def run_benchmark(
@@ -321,49 +653,68 @@ def run_benchmark(
     initial_memory = get_memory_usage()
 
     if provider == "sentence-transformers":
-        benchmark = SentenceTransformerBenchmark(model_name, config.device)
+        benchmark = SentenceTransformerBenchmark(
+            model_name, config.device, config.dtype
+        )
     elif provider == "openai":
-        benchmark = OpenAIBenchmark(model_name)
+        benchmark = OpenAIBenchmark(model_name, config.dimensions)
     elif provider == "ollama":
         benchmark = OllamaBenchmark(model_name)
     else:
         raise ValueError(f"Unknown provider: {provider}")
 
     model_memory = get_memory_usage() - initial_memory
+    dimensions = benchmark.dimensions
+    notes = f"dtype={benchmark.dtype}" if hasattr(benchmark, "dtype") else ""
     print(f"  Model loaded: {benchmark.dimensions} dimensions, {model_memory:.1f} MB")
 
     # Generate test data
     test_texts = generate_test_texts(config.throughput_samples)
 
+    # Warmup and quality phases reuse embeddings; timed iterations never do.
+    # Precision and device change the vectors, so they are part of the key
+    dtype = getattr(benchmark, "dtype", "fp32")
+    cached = CachedEncoder(
+        benchmark.encode,
+        f"{provider}:{model_name}:{dimensions}:{dtype}:{config.device}",
+        config.embedding_cache or ":memory:"
+    )
+
     # Latency benchmarks
     print("  Running latency benchmarks...")
-    latency_1 = benchmark_latency(
-        benchmark.encode, test_texts[:1],
-        config.warmup_iterations, config.latency_iterations
-    )
-    latency_8 = benchmark_latency(
-        benchmark.encode, test_texts[:8],
-        config.warmup_iterations, config.latency_iterations
-    )
-    latency_32 = benchmark_latency(
-        benchmark.encode, test_texts[:32],
-        config.warmup_iterations, config.latency_iterations
-    )
-    latency_128 = benchmark_latency(
-        benchmark.encode, test_texts[:128],
-        config.warmup_iterations, config.latency_iterations
-    )
+    latencies = {}
+    for batch_size in (1, 8, 32, 128):
+        latencies[batch_size] = benchmark_latency(
+            benchmark.encode, test_texts, batch_size,
+            config.warmup_iterations, config.latency_iterations, cached,
+            config.latency_min_iterations, config.latency_time_budget
+        )
 
-    print(f"    Latency (batch=1): {latency_1:.2f} ms")
-    print(f"    Latency (batch=32): {latency_32:.2f} ms")
+    latency_1, latency_1_p95 = latencies[1]
+    latency_8, _ = latencies[8]
+    latency_32, latency_32_p95 = latencies[32]
+    latency_128, _ = latencies[128]
 
-    # Throughput benchmarks
+    print(f"    Latency (batch=1): {latency_1:.2f} ms (p95 {latency_1_p95:.2f} ms)")
+    print(f"    Latency (batch=32): {latency_32:.2f} ms (p95 {latency_32_p95:.2f} ms)")
+
+    # Throughput benchmarks. Providers with encode_many are measured with
+    # concurrent batches, so the level is reported next to the numbers
     print("  Running throughput benchmarks...")
-    throughput_32 = benchmark_throughput(benchmark.encode, config.throughput_samples, 32)
-    throughput_128 = benchmark_throughput(benchmark.encode, config.throughput_samples, 128)
+    encode_many = getattr(benchmark, "encode_many", None)
+    concurrency = benchmark.max_concurrent if encode_many is not None else 1
+    if concurrency > 1:
+        notes = ", ".join(filter(None, [notes, f"concurrency={concurrency}"]))
+    throughput_32 = benchmark_throughput(
+        benchmark.encode, config.throughput_samples, 32, encode_many
+    )
+    throughput_128 = benchmark_throughput(
+        benchmark.encode, config.throughput_samples, 128, encode_many
+    )
 
-    print(f"    Throughput (batch=32): {throughput_32:.0f} docs/s")
-    print(f"    Throughput (batch=128): {throughput_128:.0f} docs/s")
+    in_flight = f" ({concurrency} batches in flight)" if concurrency > 1 else ""
+    print(f"    Throughput (batch=32): {throughput_32:.0f} docs/s{in_flight}")
+    print(f"    Throughput (batch=128): {throughput_128:.0f} docs/s{in_flight}")
 
     # Memory
     peak_memory = get_memory_usage()
@@ -374,19 +725,22 @@ def run_benchmark(
 
     if config.include_quality:
         print("  Running quality benchmarks...")
-        similarity_acc = evaluate_similarity_quality(benchmark.encode_single)
-        retrieval_mrr = evaluate_retrieval_quality(benchmark.encode)
+        similarity_acc = evaluate_similarity_quality(cached)
+        retrieval_mrr = evaluate_retrieval_quality(cached)
         print(f"    Similarity accuracy: {similarity_acc:.2%}")
         print(f"    Retrieval MRR: {retrieval_mrr:.4f}")
 
     # Cleanup
+    cached.close()
+    if hasattr(benchmark, "close"):
+        benchmark.close()
     del benchmark
     gc.collect()
 
     return BenchmarkResult(
         model_name=model_name,
         provider=provider,
-        dimensions=benchmark.dimensions if 'benchmark' in dir() else 0,
+        dimensions=dimensions,
         latency_single_ms=latency_1,
         latency_batch_8_ms=latency_8,
         latency_batch_32_ms=latency_32,
@@ -395,18 +749,27 @@ def run_benchmark(
         throughput_batch_128=throughput_128,
         model_memory_mb=model_memory,
         peak_memory_mb=peak_memory,
+        latency_single_p95_ms=latency_1_p95,
+        latency_batch_32_p95_ms=latency_32_p95,
+        throughput_concurrency=concurrency,
         similarity_accuracy=similarity_acc,
         retrieval_mrr=retrieval_mrr,
         timestamp=datetime.now().isoformat(),
-        device=config.device
+        device=config.device,
+        notes=notes
     )
 
 
 def format_results_table(results: List[BenchmarkResult]) -> str:
-    """Format results as ASCII table."""
+    """
+    Format results as ASCII table.
+
+    Conc is the number of batches in flight while throughput was measured;
+    throughput is only comparable between rows with the same value.
+    """
     header = (
         f"{'Model':<30} | {'Dims':>6} | {'Lat(1)':>8} | {'Lat(32)':>8} | "
-        f"{'Thrpt':>8} | {'Memory':>8} | {'MRR':>6}"
+        f"{'Thrpt':>8} | {'Conc':>4} | {'Memory':>8} | {'MRR':>6}"
     )
     separator = "-" * len(header)
 
@@ -417,7 +780,7 @@ def format_results_table(results: List[BenchmarkResult]) -> str:
         line = (
             f"{r.model_name:<30} | {r.dimensions:>6} | {r.latency_single_ms:>7.1f}ms | "
             f"{r.latency_batch_32_ms:>7.1f}ms | {r.throughput_batch_32:>6.0f}/s | "
-            f"{r.model_memory_mb:>6.0f}MB | {mrr_str:>6}"
+            f"{r.throughput_concurrency:>4} | {r.model_memory_mb:>6.0f}MB | {mrr_str:>6}"
         )
         lines.append(line)
 
@@ -460,11 +823,25 @@ Examples:
         choices=["cpu", "cuda", "mps"],
         help="Device for sentence-transformers"
     )
+    parser.add_argument(
+        "--dtype",
+        choices=["fp32", "fp16", "bf16"],
+        help="Weight precision for sentence-transformers "
+             "(default: fp32 on cpu, fp16 on cuda/mps)"
+    )
     parser.add_argument(
         "--full-suite",
         action="store_true",
         help="Run full benchmark suite with multiple models"
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Benchmark up to N suite models at once in separate processes "
+             "(they share the machine, so keep 1 for comparable latencies "
+             "or on a single GPU)"
+    )
     parser.add_argument(
         "--no-quality",
         action="store_true",
@@ -474,12 +851,24 @@ Examples:
         "--output",
         help="Output JSON file for results"
     )
+    parser.add_argument(
+        "--embedding-cache",
+        help="SQLite file caching warmup and quality embeddings across runs"
+    )
+    parser.add_argument(
+        "--dimensions",
+        type=int,
+        help="Output dimensions for OpenAI text-embedding-3 models"
+    )
 
     args = parser.parse_args()
 
     config = BenchmarkConfig(
         device=args.device,
-        include_quality=not args.no_quality
+        dtype=args.dtype,
+        include_quality=not args.no_quality,
+        embedding_cache=args.embedding_cache,
+        dimensions=args.dimensions
     )
 
     results = []
@@ -498,12 +887,25 @@ Examples:
         if HAS_OLLAMA:
             models_to_test.append(("nomic-embed-text", "ollama"))
 
-        for model_name, provider in models_to_test:
-            try:
-                result = run_benchmark(model_name, provider, config)
-                results.append(result)
-            except Exception as e:
-                print(f"  ERROR: {e}")
+        if args.parallel > 1:
+            # Each model gets its own interpreter; results keep suite order
+            with ProcessPoolExecutor(max_workers=args.parallel) as executor:
+                futures = [
+                    executor.submit(run_benchmark, model_name, provider, config)
+                    for model_name, provider in models_to_test
+                ]
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        print(f"  ERROR: {e}")
+        else:
+            for model_name, provider in models_to_test:
+                try:
+                    result = run_benchmark(model_name, provider, config)
+                    results.append(result)
+                except Exception as e:
+                    print(f"  ERROR: {e}")
 
     elif args.provider in ["openai", "ollama"]:
         model = args.model or (
@@ -24,12 +24,18 @@ Usage:
     embedding = client.encode_single("single text")
 """
 
+import asyncio
+import hashlib
 import os
+import sqlite3
+import threading
+import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import List, Literal, Optional, Tuple, Union
 
 import numpy as np
 
@@ -54,6 +60,42 @@ class EmbeddingConfig:
     api_key: Optional[str] = None
     api_base: Optional[str] = None
     dimensions: Optional[int] = None  # For Matryoshka/OpenAI dimension reduction
+    embedding_cache: Optional[str] = None  # SQLite file for computed embeddings
+
+
+# FP16/int8 conversions of ONNX models, kept out of (possibly read-only)
+# model directories
+CONVERTED_MODELS_DIR = Path.home() / ".cache" / "embedding_client" / "onnx"
+
+
+def _dedupe(texts: List[str]) -> Tuple[List[str], Optional[np.ndarray]]:
+    """
+    Return texts without repeats (first-seen order) and, if anything was
+    dropped, the row of each original text in the deduplicated list.
+    """
+    rows = {}
+    inverse = [rows.setdefault(text, len(rows)) for text in texts]
+    if len(rows) == len(texts):
+        return texts, None
+    return list(rows), np.array(inverse)
+
+
+def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in place, casting to float32 first if needed."""
+    embeddings = embeddings.astype(np.float32, copy=False)
+    norms = np.einsum("ij,ij->i", embeddings, embeddings)
+    np.sqrt(norms, out=norms)
+    np.maximum(norms, 1e-12, out=norms)
+    embeddings /= norms[:, None]
+    return embeddings
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
 
 
 class BaseEmbedder(ABC):
@@ -133,8 +175,7 @@ class SentenceTransformerEmbedder(BaseEmbedder):
             embeddings = embeddings[:, :self.target_dimensions]
 
         if normalize:
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            embeddings = embeddings / norms
+            embeddings = _l2_normalize(embeddings)
 
         return embeddings
 
@@ -158,10 +199,11 @@ class OpenAIEmbedder(BaseEmbedder):
         model_name: str = "text-embedding-3-small",
         api_key: Optional[str] = None,
         api_base: Optional[str] = None,
-        dimensions: Optional[int] = None
+        dimensions: Optional[int] = None,
+        max_concurrent: int = 8
     ):
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
         except ImportError:
             raise ImportError(
                 "openai not installed. Run: pip install openai"
@@ -178,6 +220,10 @@ class OpenAIEmbedder(BaseEmbedder):
 
         self.client = OpenAI(**kwargs)
 
+        # Async clients are bound to an event loop, so one is made per encode
+        self._async_client_factory = lambda: AsyncOpenAI(**kwargs)
+        self.max_concurrent = max_concurrent
+
         # Get dimensions from test embedding
         test_kwargs = {"input": "test", "model": model_name}
         if dimensions:
@@ -191,28 +237,61 @@ class OpenAIEmbedder(BaseEmbedder):
         batch_size: int = 100,
         normalize: bool = True
     ) -> np.ndarray:
-        all_embeddings = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-
-            kwargs = {"input": batch, "model": self._model_name}
-            if self.target_dimensions:
-                kwargs["dimensions"] = self.target_dimensions
+        texts, inverse = _dedupe(texts)
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
 
-            response = self.client.embeddings.create(**kwargs)
-            sorted_data = sorted(response.data, key=lambda x: x.index)
-            batch_embeddings = [d.embedding for d in sorted_data]
-            all_embeddings.extend(batch_embeddings)
-
-        embeddings = np.array(all_embeddings)
+        # Several batches go out concurrently, unless the caller is itself
+        # running an event loop (asyncio.run can't nest)
+        if len(batches) > 1 and not _event_loop_running():
+            batch_embeddings = asyncio.run(self._encode_batches_async(batches))
+        else:
+            batch_embeddings = [
+                self._batch_embeddings(self.client.embeddings.create(
+                    **self._request_kwargs(batch)
+                ))
+                for batch in batches
+            ]
+
+        # Fill one float32 matrix batch by batch instead of via a flat list
+        embeddings = np.empty((len(texts), self._dimensions), dtype=np.float32)
+        for i, batch in zip(range(0, len(texts), batch_size), batch_embeddings):
+            embeddings[i:i + len(batch)] = batch
 
         if normalize:
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            embeddings = embeddings / norms
+            embeddings = _l2_normalize(embeddings)
+
+        if inverse is not None:
+            embeddings = embeddings[inverse]
 
         return embeddings
 
+    async def _encode_batches_async(
+        self,
+        batches: List[List[str]]
+    ) -> List[List[List[float]]]:
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async with self._async_client_factory() as client:
+            async def encode_batch(batch: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    response = await client.embeddings.create(
+                        **self._request_kwargs(batch)
+                    )
+                return self._batch_embeddings(response)
+
+            return await asyncio.gather(*[encode_batch(b) for b in batches])
+
+    def _request_kwargs(self, batch: List[str]) -> dict:
+        kwargs = {"input": batch, "model": self._model_name}
+        if self.target_dimensions:
+            kwargs["dimensions"] = self.target_dimensions
+        return kwargs
+
+    @staticmethod
+    def _batch_embeddings(response) -> List[List[float]]:
+        sorted_data = sorted(response.data, key=lambda x: x.index)
+        return [d.embedding for d in sorted_data]
+
     def encode_single(self, text: str, normalize: bool = True) -> np.ndarray:
         return self.encode([text], normalize=normalize)[0]
 
@@ -259,24 +338,30 @@ class OllamaEmbedder(BaseEmbedder):
         batch_size: int = 32,
         normalize: bool = True
     ) -> np.ndarray:
-        embeddings = []
+        texts, inverse = _dedupe(texts)
 
-        for text in texts:
-            response = self.client.embeddings(model=self._model_name, prompt=text)
-            embeddings.append(response["embedding"])
-
-        embeddings = np.array(embeddings)
+        # Ollama takes one prompt per request; keep batch_size of them in flight
+        max_workers = max(1, min(batch_size, len(texts)))
+        embeddings = np.empty((len(texts), self._dimensions), dtype=np.float32)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for i, embedding in enumerate(executor.map(self._embed, texts)):
+                embeddings[i] = embedding
 
         # Apply Matryoshka truncation if requested
         if self.target_dimensions and self.target_dimensions < embeddings.shape[1]:
             embeddings = embeddings[:, :self.target_dimensions]
 
         if normalize:
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            embeddings = embeddings / norms
+            embeddings = _l2_normalize(embeddings)
+
+        if inverse is not None:
+            embeddings = embeddings[inverse]
 
         return embeddings
 
+    def _embed(self, text: str) -> List[float]:
+        return self.client.embeddings(model=self._model_name, prompt=text)["embedding"]
+
     def encode_single(self, text: str, normalize: bool = True) -> np.ndarray:
         return self.encode([text], normalize=normalize)[0]
 
@@ -292,13 +377,17 @@ class OllamaEmbedder(BaseEmbedder):
 class ONNXEmbedder(BaseEmbedder):
     """ONNX Runtime backend for optimized inference."""
 
+    # Converted models are never loaded as the source model
+    _DERIVED_SUFFIXES = (".fp16.onnx", ".int8.onnx")
+
     def __init__(
         self,
         model_path: str,
         tokenizer_path: Optional[str] = None,
         max_length: int = 256,
         num_threads: int = 4,
-        target_dimensions: Optional[int] = None
+        target_dimensions: Optional[int] = None,
+        quantize: Literal["none", "fp16", "int8"] = "none"
     ):
         try:
             import onnxruntime as ort
@@ -325,7 +414,10 @@ class ONNXEmbedder(BaseEmbedder):
         # Find ONNX file
         model_dir = Path(model_path)
         if model_dir.is_dir():
-            onnx_files = list(model_dir.glob("*.onnx"))
+            onnx_files = [
+                p for p in model_dir.glob("*.onnx")
+                if not p.name.endswith(self._DERIVED_SUFFIXES)
+            ]
             if onnx_files:
                 onnx_path = str(onnx_files[0])
             else:
@@ -333,6 +425,11 @@ class ONNXEmbedder(BaseEmbedder):
         else:
             onnx_path = model_path
 
+        if quantize == "fp16":
+            onnx_path = self._convert_fp16(onnx_path)
+        elif quantize == "int8":
+            onnx_path = self._quantize_int8(onnx_path)
+
         self.session = ort.InferenceSession(
             onnx_path,
             sess_options=sess_options,
@@ -340,43 +437,123 @@ class ONNXEmbedder(BaseEmbedder):
         )
 
         self.input_names = [inp.name for inp in self.session.get_inputs()]
+        self._pad_id = self.tokenizer.pad_token_id or 0
 
         # Determine dimensions from test inference
-        test_emb = self._encode_batch(["test"])
+        test_emb = self._encode_batch(self._tokenize(["test"]))
         self._dimensions = test_emb.shape[1]
 
+    @staticmethod
+    def _converted(onnx_path: str, suffix: str, convert) -> str:
+        """
+        Return the cached conversion of onnx_path, running convert if needed.
+
+        Conversions live under CONVERTED_MODELS_DIR, keyed by the source
+        path, size and mtime, so a changed model is converted again. If the
+        conversion cannot be written, the fp32 model path is returned.
+        """
+        source = Path(onnx_path).resolve()
+        stat = source.stat()
+        key = hashlib.sha256(
+            f"{source}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8")
+        ).hexdigest()[:16]
+        target = CONVERTED_MODELS_DIR / f"{source.stem}-{key}{suffix}"
+        if target.exists():
+            return str(target)
+
+        # Written under a temporary name and renamed, so a failed or
+        # concurrent conversion never leaves a partial model behind
+        tmp = target.with_name(f"{target.stem}.{os.getpid()}.tmp.onnx")
+        try:
+            CONVERTED_MODELS_DIR.mkdir(parents=True, exist_ok=True)
+            convert(str(source), str(tmp))
+            os.replace(tmp, target)
+        except OSError as e:
+            warnings.warn(f"Could not cache {suffix} model, using fp32: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return onnx_path
+        return str(target)
+
+    @classmethod
+    def _convert_fp16(cls, onnx_path: str) -> str:
+        """Convert weights and activations to FP16 once, cached on disk."""
+        def convert(source: str, target: str):
+            from onnxruntime.transformers.optimizer import optimize_model
+
+            # opt_level=0 runs only the Python-side BERT fusions; the session
+            # applies ORT's own graph optimizations at load time
+            model = optimize_model(source, model_type="bert", opt_level=0)
+            model.convert_float_to_float16(keep_io_types=False)
+            model.save_model_to_file(target)
+
+        return cls._converted(onnx_path, ".fp16.onnx", convert)
+
+    @classmethod
+    def _quantize_int8(cls, onnx_path: str) -> str:
+        """Dynamically quantize MatMul/Gemm weights to int8 once, cached on disk."""
+        def convert(source: str, target: str):
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantize_dynamic(
+                source,
+                target,
+                weight_type=QuantType.QInt8,
+                op_types_to_quantize=["MatMul", "Gemm"]
+            )
+
+        return cls._converted(onnx_path, ".int8.onnx", convert)
+
     def _mean_pooling(
         self,
         token_embeddings: np.ndarray,
         attention_mask: np.ndarray
     ) -> np.ndarray:
-        input_mask_expanded = np.expand_dims(attention_mask, axis=-1)
-        sum_embeddings = np.sum(token_embeddings * input_mask_expanded, axis=1)
-        sum_mask = np.clip(np.sum(input_mask_expanded, axis=1), a_min=1e-9, a_max=None)
+        # Masked sum over tokens as one batched matmul: (B, 1, T) @ (B, T, D)
+        mask = attention_mask.astype(token_embeddings.dtype)
+        sum_embeddings = np.matmul(mask[:, None, :], token_embeddings)[:, 0]
+        sum_mask = np.maximum(mask.sum(axis=1, keepdims=True), 1e-9)
         return sum_embeddings / sum_mask
 
-    def _encode_batch(self, texts: List[str]) -> np.ndarray:
-        inputs = self.tokenizer(
+    def _tokenize(self, texts: List[str]) -> List[List[int]]:
+        return self.tokenizer(
             texts,
-            padding=True,
             truncation=True,
-            max_length=self.max_length,
-            return_tensors="np"
+            max_length=self.max_length
+        )["input_ids"]
+
+    def _encode_batch(self, token_ids: List[List[int]]) -> np.ndarray:
+        # Pad the batch to its own longest member
+        lengths = np.array([len(ids) for ids in token_ids])
+        input_ids = np.full(
+            (len(token_ids), lengths.max()), self._pad_id, dtype=np.int64
         )
+        for row, ids in enumerate(token_ids):
+            input_ids[row, :len(ids)] = ids
+        attention_mask = (
+            np.arange(input_ids.shape[1]) < lengths[:, None]
+        ).astype(np.int64)
 
         onnx_inputs = {
-            "input_ids": inputs["input_ids"].astype(np.int64),
-            "attention_mask": inputs["attention_mask"].astype(np.int64)
+            "input_ids": input_ids,
+            "attention_mask": attention_mask
         }
 
         if "token_type_ids" in self.input_names:
-            onnx_inputs["token_type_ids"] = inputs.get(
-                "token_type_ids",
-                np.zeros_like(inputs["input_ids"])
-            ).astype(np.int64)
+            # Single-sequence inputs all belong to segment 0
+            onnx_inputs["token_type_ids"] = np.zeros_like(input_ids)
+
+        # Graph optimization can prune inputs the model never reads
+        onnx_inputs = {
+            name: value for name, value in onnx_inputs.items()
+            if name in self.input_names
+        }
 
         outputs = self.session.run(None, onnx_inputs)
-        return self._mean_pooling(outputs[0], inputs["attention_mask"])
+        token_embeddings = outputs[0].astype(np.float32, copy=False)
+        return self._mean_pooling(token_embeddings, attention_mask)
 
     def encode(
         self,
@@ -384,22 +561,33 @@ class ONNXEmbedder(BaseEmbedder):
         batch_size: int = 32,
         normalize: bool = True
     ) -> np.ndarray:
+        texts, inverse = _dedupe(texts)
+
+        # Tokenize once, then batch sequences of similar length together so
+        # each batch pads only to its own longest member
+        token_ids = self._tokenize(texts)
+        order = np.argsort([len(ids) for ids in token_ids], kind="stable")
+
         all_embeddings = []
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
+        for i in range(0, len(order), batch_size):
+            batch = [token_ids[j] for j in order[i:i + batch_size]]
             embeddings = self._encode_batch(batch)
             all_embeddings.append(embeddings)
 
-        embeddings = np.vstack(all_embeddings)
+        sorted_embeddings = np.vstack(all_embeddings)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
 
         # Apply Matryoshka truncation if requested
         if self.target_dimensions and self.target_dimensions < embeddings.shape[1]:
             embeddings = embeddings[:, :self.target_dimensions]
 
         if normalize:
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            embeddings = embeddings / norms
+            embeddings = _l2_normalize(embeddings)
+
+        if inverse is not None:
+            embeddings = embeddings[inverse]
 
         return embeddings
 
@@ -415,6 +603,94 @@ class ONNXEmbedder(BaseEmbedder):
         return self._model_name
 
 
+class CachedEmbedder(BaseEmbedder):
+    """
+    Persistent embedding cache in front of another backend.
+
+    Vectors are stored in SQLite as float32 bytes, keyed by SHA-256 of
+    provider, model, dimensions and text. Only cache misses reach the
+    wrapped backend, and they are stored unnormalized so either
+    normalization setting can be served from the same entry. The shared
+    connection is used under a lock, so encode() may be called from
+    several threads.
+    """
+
+    # Stay below SQLite's bound-parameter limit per lookup query
+    _LOOKUP_CHUNK = 500
+
+    def __init__(self, embedder: BaseEmbedder, provider: str, path: str):
+        self._embedder = embedder
+        self._key_prefix = f"{provider}|{embedder.model_name}|{embedder.dimensions}|"
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vec BLOB)"
+        )
+
+    def encode(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        normalize: bool = True
+    ) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+
+        keys = [
+            hashlib.sha256((self._key_prefix + text).encode("utf-8")).digest()
+            for text in texts
+        ]
+
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for i in range(0, len(unique_keys), self._LOOKUP_CHUNK):
+            chunk = unique_keys[i:i + self._LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self.conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+            for key, vec in rows:
+                found[key] = np.frombuffer(vec, dtype=np.float32)
+
+        misses = {key: text for key, text in zip(keys, texts) if key not in found}
+        if misses:
+            computed = self._embedder.encode(
+                list(misses.values()), batch_size=batch_size, normalize=False
+            ).astype(np.float32)
+            found.update(zip(misses, computed))
+            with self._lock, self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?)",
+                    [(key, vec.tobytes()) for key, vec in zip(misses, computed)]
+                )
+
+        embeddings = np.stack([found[key] for key in keys])
+
+        if normalize:
+            embeddings = _l2_normalize(embeddings)
+
+        return embeddings
+
+    def encode_single(self, text: str, normalize: bool = True) -> np.ndarray:
+        return self.encode([text], normalize=normalize)[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    @property
+    def dimensions(self) -> int:
+        return self._embedder.dimensions
+
+    @property
+    def model_name(self) -> str:
+        return self._embedder.model_name
+
+
 class EmbeddingClient:
     """
     Unified embedding client with automatic provider selection.
@@ -441,7 +717,8 @@ class EmbeddingClient:
         dimensions: Optional[int] = None,
         cache_dir: Optional[str] = None,
         api_key: Optional[str] = None,
-        api_base: Optional[str] = None
+        api_base: Optional[str] = None,
+        embedding_cache: Optional[str] = None
     ):
         """
         Initialize embedding client.
@@ -456,6 +733,7 @@ class EmbeddingClient:
             cache_dir: Cache directory for models
             api_key: API key for OpenAI
             api_base: Base URL for API providers
+            embedding_cache: SQLite file caching computed embeddings
         """
         self.normalize = normalize
         self.batch_size = batch_size
@@ -483,6 +761,11 @@ class EmbeddingClient:
             api_base=api_base
         )
 
+        if embedding_cache:
+            self._embedder = CachedEmbedder(
+                self._embedder, provider.value, embedding_cache
+            )
+
         self._provider = provider
 
     def _auto_detect_provider(self) -> Provider:
@@ -613,11 +896,9 @@ class EmbeddingClient:
         else:
             emb2 = text2
 
-        # Normalize for cosine similarity
-        emb1 = emb1 / np.linalg.norm(emb1)
-        emb2 = emb2 / np.linalg.norm(emb2)
-
-        return float(np.dot(emb1, emb2))
+        # Cosine similarity without materializing normalized copies
+        norms = np.sqrt(np.dot(emb1, emb1) * np.dot(emb2, emb2))
+        return float(np.dot(emb1, emb2) / norms)
 
     @property
     def dimensions(self) -> int:
@@ -634,6 +915,18 @@ class EmbeddingClient:
         """Return provider name."""
         return self._provider.value
 
+    def close(self):
+        """Release the backend's resources, such as the embedding cache."""
+        close = getattr(self._embedder, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "EmbeddingClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def __repr__(self) -> str:
         return (
             f"EmbeddingClient(provider='{self.provider}', "
@@ -25,6 +25,7 @@ Usage:
 """
 
 import json
+import struct
 import threading
 import time
 import uuid
@@ -37,6 +38,7 @@ import logging
 
 try:
     import chromadb
+    import numpy as np
     from chromadb.config import Settings
     from chromadb.utils import embedding_functions
 except ImportError:
@@ -45,6 +47,54 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# bf16 sidecar header: little-endian (count, dim) as uint32
+BF16_HEADER = struct.Struct("<II")
+
+
+def write_bf16(path: str, embeddings: Any) -> Tuple[int, int]:
+    """
+    Write embeddings to a raw bf16 file with a (count, dim) header.
+
+    Rounds FP32 to the nearest bf16 (ties to even) by keeping the top
+    16 bits of each float, halving the on-disk size. NaNs are written as
+    the canonical quiet NaN, since rounding could turn them into Inf or 0.
+
+    Returns:
+        (count, dim) of the written matrix
+    """
+    values = np.ascontiguousarray(embeddings, dtype=np.float32)
+    bits = values.view(np.uint32)
+    count, dim = bits.shape if bits.ndim == 2 else (0, 0)
+    rounded = (bits + 0x7FFF + ((bits >> 16) & 1)) >> 16
+    rounded = np.where(np.isnan(values), 0x7FC0, rounded)
+
+    with open(path, "wb") as f:
+        f.write(BF16_HEADER.pack(count, dim))
+        f.write(rounded.astype("<u2").tobytes())
+
+    return count, dim
+
+
+def read_bf16(path: str) -> "np.ndarray":
+    """
+    Read a bf16 file written by write_bf16 back into an FP32 matrix.
+
+    Raises:
+        ValueError: If the data length does not match the (count, dim) header
+    """
+    with open(path, "rb") as f:
+        count, dim = BF16_HEADER.unpack(f.read(BF16_HEADER.size))
+        data = f.read()
+
+    if len(data) != count * dim * 2:
+        raise ValueError(
+            f"{path}: header says {count}x{dim} bf16 values "
+            f"({count * dim * 2} bytes), file has {len(data)} bytes"
+        )
+    raw = np.frombuffer(data, dtype="<u2")
+
+    return (raw.astype(np.uint32) << 16).view(np.float32).reshape(count, dim)
+
 
 @dataclass
 class ChromaConfig:
@@ -557,7 +607,8 @@ class BackupManager:
         self,
         collection: str,
         output_path: str,
-        include_embeddings: bool = False
+        include_embeddings: bool = False,
+        embedding_format: str = "float32"
     ) -> int:
         """
         Export collection to JSON file.
@@ -566,10 +617,15 @@ class BackupManager:
             collection: Collection name
             output_path: Output file path
             include_embeddings: Include embedding vectors (large!)
+            embedding_format: "float32" (inline JSON) or "bf16" (raw
+                <output>.bf16.bin sidecar at half the size)
 
         Returns:
             Number of documents exported
         """
+        if embedding_format not in ("float32", "bf16"):
+            raise ValueError(f"Unknown embedding format: {embedding_format}")
+
         coll = self.store.manager.get_collection(collection)
 
         include = ["documents", "metadatas"]
@@ -578,6 +634,8 @@ class BackupManager:
 
         # Get all documents
         results = coll.get(include=include)
+        embeddings = results.get("embeddings") if include_embeddings else None
+        inline_embeddings = embeddings is not None and embedding_format == "float32"
 
         # Format for export
         documents = []
@@ -587,8 +645,8 @@ class BackupManager:
                 "content": results["documents"][i] if results.get("documents") else None,
                 "metadata": results["metadatas"][i] if results.get("metadatas") else {}
             }
-            if include_embeddings and results.get("embeddings"):
-                doc["embedding"] = results["embeddings"][i]
+            if inline_embeddings:
+                doc["embedding"] = [float(x) for x in embeddings[i]]
 
             documents.append(doc)
 
@@ -600,6 +658,12 @@ class BackupManager:
             "documents": documents
         }
 
+        if embeddings is not None and embedding_format == "bf16":
+            sidecar = Path(output_path).with_suffix(".bf16.bin")
+            count, dim = write_bf16(str(sidecar), embeddings)
+            export_data["embeddings_file"] = sidecar.name
+            export_data["embeddings_shape"] = [count, dim]
+
         with open(output_path, 'w') as f:
             json.dump(export_data, f, indent=2)
 
@@ -641,7 +705,17 @@ class BackupManager:
         metadatas = [d.get("metadata", {}) for d in documents]
         embeddings = None
 
-        if documents and "embedding" in documents[0]:
+        if data.get("embeddings_file"):
+            sidecar = Path(input_path).parent / data["embeddings_file"]
+            matrix = read_bf16(str(sidecar))
+            expected = data.get("embeddings_shape")
+            if expected is not None and list(matrix.shape) != list(expected):
+                raise ValueError(
+                    f"{sidecar} holds a {matrix.shape[0]}x{matrix.shape[1]} "
+                    f"matrix, export header says {expected[0]}x{expected[1]}"
+                )
+            embeddings = matrix.tolist()
+        elif documents and "embedding" in documents[0]:
             embeddings = [d["embedding"] for d in documents]
 
         self.store.add(